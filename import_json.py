@@ -1,13 +1,22 @@
 import json
 import logging
+import re
 
 from chimera_autarch import ToolResult
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 try:
     import ollama
     OLLAMA_AVAILABLE = True
+    # Async client so model calls never block the event loop
+    _ollama_client = ollama.AsyncClient()
     logger.info("[INTENT] Ollama detected - AI-powered intent compilation enabled")
 except ImportError:
     OLLAMA_AVAILABLE = False
@@ -18,6 +27,14 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from chimera_autarch import ToolRegistry
 
+# Every fallback trigger phrase, found in a single scan of the lowercased intent
+_TRIGGER_RE = re.compile(
+    r"federated|distributed train|thorough|optimize|speed"
+    r"|symbiotic|initialize arm|status|health"
+)
+# First whitespace-delimited token that looks like a function/class name
+_FUNC_NAME_RE = re.compile(r"(?<!\S)[_A-Z]\S*")
+
 class IntentCompiler:
     """Compiles natural language intents into tool execution plans"""
     
@@ -50,7 +67,7 @@ class IntentCompiler:
         tools_context = "\n".join(available_tools)
         
         # Query Ollama with CHIMERA-specific system prompt
-        response = ollama.chat(
+        response = await _ollama_client.chat(
             model='dagbs/qwen2.5-coder-14b-instruct-abliterated:q5_k_m',
             messages=[{
                 'role': 'system',
@@ -85,7 +102,7 @@ OUTPUT FORMAT (JSON only, no explanations):
             lines = content.split('\n')
             content = '\n'.join(lines[1:-1]) if len(lines) > 2 else content
         
-        tool_calls = json.loads(content)
+        tool_calls = _json_loads(content)
         
         # Validate against registry (critical: prevent hallucinated tools)
         validated = []
@@ -108,36 +125,36 @@ OUTPUT FORMAT (JSON only, no explanations):
     
     async def _fallback_patterns(self, intent: str) -> list[tuple[str, dict[str, any]]]:
         """Pattern-based compilation (graceful degradation)"""
-        intent_lower = intent.lower()
+        hits = set(_TRIGGER_RE.findall(intent.lower()))
         plan = []
         
         # Federated learning triggers
-        if "federated" in intent_lower or "distributed train" in intent_lower:
-            rounds = 5 if "thorough" in intent_lower else 3
+        if "federated" in hits or "distributed train" in hits:
+            rounds = 5 if "thorough" in hits else 3
             plan.append(("start_federated_training", {
                 "topic": "general",
                 "num_rounds": rounds
             }))
         
         # Code optimization patterns
-        if "optimize" in intent_lower:
+        if "optimize" in hits:
             # Extract function name if mentioned
-            words = intent.split()
-            func_name = next((w for w in words if w.startswith("_") or w[0].isupper()), None)
+            match = _FUNC_NAME_RE.search(intent)
+            func_name = match.group() if match else None
             
             plan.append(("analyze_and_suggest_patch", {
                 "function_name": func_name or "unknown",
-                "goal": "performance" if "speed" in intent_lower else "efficiency"
+                "goal": "performance" if "speed" in hits else "efficiency"
             }))
         
         # Symbiotic arm initialization
-        if "symbiotic" in intent_lower or "initialize arm" in intent_lower:
+        if "symbiotic" in hits or "initialize arm" in hits:
             plan.append(("initialize_symbiotic_link", {
                 "capabilities": ["compute", "learning"]
             }))
         
         # System status queries
-        if "status" in intent_lower or "health" in intent_lower:
+        if "status" in hits or "health" in hits:
             plan.append(("get_system_status", {}))
         
         logger.info(f"[INTENT] Pattern match: {len(plan)} tool call(s)")
@@ -152,7 +169,7 @@ OUTPUT FORMAT (JSON only, no explanations):
         async def _tool_ai_analyze(query: str, context: str = "") -> ToolResult[dict[str, Any]]:
             """Use local AI for complex analysis tasks"""
             try:
-                response = ollama.chat(
+                response = await _ollama_client.chat(
                     model='dagbs/qwen2.5-coder-14b-instruct-abliterated:q5_k_m',
                     messages=[{
                         'role': 'system',
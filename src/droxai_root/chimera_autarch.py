@@ -15,6 +15,7 @@ import ssl
 import secrets
 import traceback
 import os
+import sys
 import warnings
 
 # Suppress protobuf deprecation warnings (Python â‰¥3.14 compatibility)
@@ -34,12 +35,19 @@ except Exception:  # ImportError or any runtime issue
 # LLM Integration – guarded at runtime
 LLM_AVAILABLE = False
 try:
-    from llm_integration import LocalLLMProvider, OpenAIProvider, AnthropicProvider, CodeGenerator as LLMCodeGenerator
+    from llm_integration import LocalLLMProvider, OpenAIProvider, AnthropicProvider, CodeGenerator as LLMCodeGenerator, close_shared_client
     LLM_AVAILABLE = True
 except Exception as e:
     if logger:
         logger.warning(f"LLM integration unavailable: {e}")
 
+# uvloop – libuv event loop with cheaper awaits; POSIX only
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # --------------------------------------------------------------------------- #
 # Logging â€“ structured, timestamped, color-ready for production
 # --------------------------------------------------------------------------- #
@@ -900,6 +908,10 @@ def create_dashboard_handler(heart_node):
 # Production Entry Point â€“ TLS-aware, graceful shutdown
 # --------------------------------------------------------------------------- #
 async def main():
+    # Tasks whose coroutines finish without suspending skip the loop round trip (3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # TLS auto-detect
     ssl_ctx = None
     for base in ["ssl/", ""]:
@@ -940,6 +952,13 @@ async def main():
         httpd.shutdown()
         ws_server.close()
         await ws_server.wait_closed()
+        if LLM_AVAILABLE:
+            if heart.llm_generator:
+                heart.llm_generator.close()
+            await close_shared_client()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -366,6 +366,9 @@ class ChimeraNexusIntegration:
         """Gracefully shutdown all systems"""
         logger.info("[NEXUS] Shutting down CHIMERA NEXUS v3.0...")
 
+        if self.neural_engine:
+            self.neural_engine.close()
+
         if self.voice:
             await self.voice.shutdown()
 
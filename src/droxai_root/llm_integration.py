@@ -3,21 +3,128 @@
 CHIMERA AUTARCH - LLM Integration Module
 AI-Powered Code Generation with Self-Healing and Rollback
 """
+import ast
 import asyncio
 import os
 import json
 import hashlib
-import subprocess
+import importlib.util
+import io
+import re
 import tempfile
-from typing import Optional, Dict, Any, List
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Set, Deque, Tuple, Callable, Awaitable
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass
 from pathlib import Path
 import logging
 
 logger = logging.getLogger("chimera.llm")
 
+# orjson is several times faster on the large contexts embedded in prompts
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _json_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS, default=str)
+
+    def _json_text(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+        option = _ORJSON_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option, default=str).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+    def _json_text(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None,
+                          sort_keys=sort_keys, default=str)
+
+# Aho-Corasick matches the whole risk blocklist in one linear scan
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Patch checksums only key dedup/history maps, never security decisions;
+# prefer SIMD-accelerated BLAKE3 when installed
+try:
+    from blake3 import blake3 as _code_hasher
+except ImportError:
+    _code_hasher = hashlib.sha256
+
+
+def _preimport():
+    """Warm a test worker: load pytest and common test deps once per process"""
+    os.environ["PYTEST_DISABLE_PLUGIN_AUTOLOAD"] = "1"
+    import pytest  # noqa: F401
+    import unittest.mock  # noqa: F401
+
+
+def _run_pytest(test_file: str) -> tuple:
+    """Run pytest in-process on a single file, returning (exit_code, output)"""
+    import pytest
+
+    args = [test_file, '-v', '--tb=short',
+            '-p', 'no:cacheprovider', '-p', 'no:randomly']
+    # Autoload is off, so load pytest-asyncio explicitly for the
+    # @pytest.mark.asyncio tests the generator asks for
+    if importlib.util.find_spec('pytest_asyncio') is not None:
+        args += ['-p', 'pytest_asyncio.plugin']
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        exit_code = pytest.main(args)
+    return int(exit_code), output.getvalue()
+
+
+FUSED_SYSTEM_PROMPT = """You are an expert Python code generator for CHIMERA AUTARCH, a self-evolving AI system.
+Generate production-ready, type-annotated Python code with error handling, plus pytest tests for it.
+Follow these rules:
+1. Use async/await for all I/O operations
+2. Include comprehensive error handling and logging
+3. Write idiomatic Python 3.12+ code with type hints
+4. Tests use pytest, cover happy path and edge cases, and mock external dependencies
+5. Respond with ONLY a JSON object of the form {"code": "<python module>", "tests": "<pytest module>"}"""
+
+
+def _strip_fences(text: str) -> str:
+    """Return the body of the first fenced code block in text, or text itself"""
+    text = text.strip()
+
+    start = text.find('```')
+    if start != -1:
+        newline = text.find('\n', start)
+        text = text[newline + 1:] if newline != -1 else ''
+        end = text.find('```')
+        if end != -1:
+            text = text[:end]
+
+    return text.strip()
+
+
+def _parse_code_and_tests(text: str) -> Tuple[str, str]:
+    """Decode a fused {"code", "tests"} reply, raising ValueError if unusable"""
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError("Fused reply contains no JSON object")
+    data = _json_loads(text[start:end + 1])
+    if not isinstance(data, dict) or not isinstance(data.get("code"), str) \
+            or not isinstance(data.get("tests"), str):
+        raise ValueError("Fused reply is missing 'code' or 'tests'")
+    return data["code"], data["tests"]
 
-@dataclass
+
+@dataclass(slots=True)
 class CodePatch:
     """Represents a generated code patch with metadata"""
     code: str
@@ -28,10 +135,11 @@ class CodePatch:
     checksum: Optional[str] = None
 
     def __post_init__(self):
-        self.checksum = hashlib.sha256(self.code.encode()).hexdigest()
+        # 128 bits is plenty for an in-memory dedup key
+        self.checksum = _code_hasher(self.code.encode()).hexdigest()[:32]
 
 
-@dataclass
+@dataclass(slots=True)
 class PatchResult:
     """Result of applying and testing a patch"""
     success: bool
@@ -44,6 +152,8 @@ class PatchResult:
 class LLMProvider:
     """Base class for LLM providers"""
 
+    __slots__ = ()
+
     async def generate_code(self, prompt: str, context: Dict[str, Any]) -> str:
         raise NotImplementedError
 
@@ -54,14 +164,22 @@ class LLMProvider:
         """General chat capability"""
         raise NotImplementedError
 
-    async def chat(self, prompt: str, context: Dict[str, Any]) -> str:
-        """General chat capability"""
+    async def generate_code_and_tests(self, prompt: str, context: Dict[str, Any]) -> Tuple[str, str]:
+        """Generate code and its tests in a single model call"""
         raise NotImplementedError
 
+    async def generate_batch(self, prompts: List[str], context: Dict[str, Any]) -> List[str]:
+        """Generate code for several prompts concurrently (results keep prompt order)"""
+        return list(await asyncio.gather(
+            *(self.generate_code(prompt, context) for prompt in prompts)
+        ))
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT-4/GPT-4 Turbo provider"""
 
+    __slots__ = ("api_key", "model", "available", "client")
+
     def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4-turbo-preview"):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
@@ -94,7 +212,7 @@ Follow these rules:
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user",
-                "content": f"Context: {json.dumps(context, indent=2)}\n\nTask: {prompt}"}
+                "content": f"Context: {_json_text(context, indent=True)}\n\nTask: {prompt}"}
         ]
 
         response = await self.client.chat.completions.create(
@@ -116,7 +234,7 @@ Follow these rules:
 {code}
 ```
 
-Context: {json.dumps(context, indent=2)}
+Context: {_json_text(context, indent=True)}
 
 Requirements:
 1. Use pytest framework
@@ -140,6 +258,26 @@ Requirements:
 
         return response.choices[0].message.content.strip()
 
+    async def generate_code_and_tests(self, prompt: str, context: Dict[str, Any]) -> Tuple[str, str]:
+        if not self.available:
+            raise RuntimeError("OpenAI provider not available")
+
+        messages = [
+            {"role": "system", "content": FUSED_SYSTEM_PROMPT},
+            {"role": "user",
+                "content": f"Context: {_json_text(context, indent=True)}\n\nTask: {prompt}"}
+        ]
+
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.2,
+            max_tokens=3500,
+            response_format={"type": "json_object"}
+        )
+
+        return _parse_code_and_tests(response.choices[0].message.content)
+
     async def chat(self, prompt: str, context: Dict[str, Any]) -> str:
         if not self.available:
             raise RuntimeError("OpenAI provider not available")
@@ -162,6 +300,8 @@ Requirements:
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude provider"""
 
+    __slots__ = ("api_key", "model", "available", "client")
+
     def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-5-sonnet-20241022"):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
@@ -191,7 +331,7 @@ Follow these rules:
 6. Keep functions focused and testable
 7. Return ONLY the code, no explanations"""
 
-        message = f"Context: {json.dumps(context, indent=2)}\n\nTask: {prompt}"
+        message = f"Context: {_json_text(context, indent=True)}\n\nTask: {prompt}"
 
         response = await self.client.messages.create(
             model=self.model,
@@ -213,7 +353,7 @@ Follow these rules:
 {code}
 ```
 
-Context: {json.dumps(context, indent=2)}
+Context: {_json_text(context, indent=True)}
 
 Requirements:
 1. Use pytest framework
@@ -233,6 +373,22 @@ Requirements:
 
         return response.content[0].text.strip()
 
+    async def generate_code_and_tests(self, prompt: str, context: Dict[str, Any]) -> Tuple[str, str]:
+        if not self.available:
+            raise RuntimeError("Anthropic provider not available")
+
+        message = f"Context: {_json_text(context, indent=True)}\n\nTask: {prompt}"
+
+        response = await self.client.messages.create(
+            model=self.model,
+            max_tokens=3500,
+            temperature=0.2,
+            system=FUSED_SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": message}]
+        )
+
+        return _parse_code_and_tests(response.content[0].text)
+
     async def chat(self, prompt: str, context: Dict[str, Any]) -> str:
         if not self.available:
             raise RuntimeError("Anthropic provider not available")
@@ -248,19 +404,82 @@ Requirements:
         return response.content[0].text.strip()
 
 
+# One connection pool shared by every LocalLLMProvider, created on first use.
+# Its connections belong to the event loop that opened them, so the client is
+# rebuilt whenever it is used from a different loop.
+_SHARED_CLIENT = None
+_SHARED_CLIENT_LOOP = None
+
+
+def _get_shared_client():
+    """Return the Ollama HTTP client for the running event loop, creating it if needed"""
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    import httpx
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if (_SHARED_CLIENT is None or _SHARED_CLIENT.is_closed
+            or (loop is not None and loop is not _SHARED_CLIENT_LOOP)):
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        # A client left on a previous loop is dropped, not closed: its
+        # transports cannot be shut down from here
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=2.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+            http2=http2)
+        _SHARED_CLIENT_LOOP = loop
+    elif _SHARED_CLIENT_LOOP is None:
+        # Created outside any loop; the first loop to use it owns it
+        _SHARED_CLIENT_LOOP = loop
+    return _SHARED_CLIENT
+
+
+def _transport_errors() -> Tuple[type, ...]:
+    """Exceptions meaning an Ollama request failed, as opposed to a bad reply"""
+    try:
+        import httpx
+        return (httpx.HTTPError, OSError)
+    except ImportError:
+        return (OSError,)
+
+
+async def close_shared_client():
+    """Close the shared Ollama HTTP client (call once on shutdown)"""
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    client, owner = _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    _SHARED_CLIENT = _SHARED_CLIENT_LOOP = None
+    if client is not None and owner in (None, asyncio.get_running_loop()):
+        await client.aclose()
+
+
 class LocalLLMProvider(LLMProvider):
     """Local LLM provider using Ollama or similar"""
 
+    __slots__ = ("base_url", "model", "available", "max_parallel",
+                 "_semaphore", "_semaphore_loop")
+
+    # Smallest fenced block worth stopping the stream for
+    MIN_FENCED_CODE = 32
+
     def __init__(self, base_url: str = "http://localhost:11434", model: str = None):
         self.base_url = base_url
         # Auto-detect best available model
         self.model = model or self._get_best_model()
         self.available = False
+        # Bound in-flight requests to what the Ollama server will run in parallel
+        self.max_parallel = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+        # Created per event loop, like the shared client (see _loop_semaphore)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
 
         # Check if Ollama is available
         try:
-            import httpx
-            self.client = httpx.AsyncClient(timeout=60.0)
+            import httpx  # noqa: F401
             self.available = True
             logger.info(
                 f"Local LLM provider initialized with model: {self.model}")
@@ -268,6 +487,60 @@ class LocalLLMProvider(LLMProvider):
             logger.warning(
                 "httpx library not installed. Run: pip install httpx")
 
+    @property
+    def client(self):
+        """Shared HTTP client for the current event loop"""
+        return _get_shared_client()
+
+    def _loop_semaphore(self) -> asyncio.Semaphore:
+        """Request limiter for the running event loop
+
+        A semaphore binds to the first loop that waits on it, so a provider
+        reused from another loop gets a fresh one.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_parallel)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _generate(self, payload: Dict[str, Any], stop_at_fence: bool = False) -> str:
+        """POST a generation request to Ollama and return the stripped response text
+
+        Streamed replies are assembled chunk by chunk; with stop_at_fence the
+        read ends as soon as a fenced code block has been closed.
+        """
+        chunks: List[str] = []
+        async with self._loop_semaphore():
+            async with self.client.stream(
+                    "POST", f"{self.base_url}/api/generate",
+                    content=_json_bytes(payload),
+                    headers={"content-type": "application/json"}) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    data = _json_loads(line)
+                    chunk = data.get("response", "")
+                    chunks.append(chunk)
+                    if data.get("done"):
+                        break
+                    if stop_at_fence and "`" in chunk and self._fence_closed(chunks):
+                        logger.debug("Code fence closed, ending stream early")
+                        break
+        return "".join(chunks).strip()
+
+    @staticmethod
+    def _fence_closed(chunks: List[str]) -> bool:
+        """True once the text holds a complete, non-trivial fenced code block"""
+        text = "".join(chunks)
+        start = text.find("```")
+        if start == -1:
+            return False
+        end = text.find("```", text.find("\n", start) + 1)
+        return end != -1 and end - start > LocalLLMProvider.MIN_FENCED_CODE
+
+
     def _get_best_model(self) -> str:
         """Auto-detect best available local model"""
         # Priority order: Qwen 2.5 Coder > DeepSeek Coder > CodeLlama > fallback
@@ -313,40 +586,22 @@ async def my_function(param: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 ```"""
 
-        full_prompt = f"{system_prompt}\n\nContext:\n{json.dumps(context, indent=2)}\n\nTask: {prompt}\n\nGenerate the Python code:"
+        full_prompt = f"{system_prompt}\n\nContext:\n{_json_text(context, indent=True)}\n\nTask: {prompt}\n\nGenerate the Python code:"
 
         try:
-            response = await self.client.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": full_prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.2,
-                        "top_p": 0.9,
-                        "num_predict": 2000,
-                    }
+            generated = await self._generate({
+                "model": self.model,
+                "prompt": full_prompt,
+                "stream": True,
+                "options": {
+                    "temperature": 0.2,
+                    "top_p": 0.9,
+                    "num_predict": 2000,
                 }
-            )
-            response.raise_for_status()
-
-            generated = response.json()["response"].strip()
+            }, stop_at_fence=True)
 
             # Clean up the response (remove markdown if present)
-            if "```python" in generated:
-                # Extract code from markdown blocks
-                parts = generated.split("```python")
-                if len(parts) > 1:
-                    code = parts[1].split("```")[0].strip()
-                    return code
-            elif "```" in generated:
-                # Generic code block
-                parts = generated.split("```")
-                if len(parts) >= 3:
-                    return parts[1].strip()
-
-            return generated
+            return _strip_fences(generated)
 
         except Exception as e:
             logger.error(f"Local LLM generation failed: {e}")
@@ -357,80 +612,38 @@ async def my_function(param: str) -> Dict[str, Any]:
                 return await self.generate_code(prompt, context)
             raise
 
-    async def generate_tests(self, code: str, context: Dict[str, Any]) -> str:
+    async def generate_code_and_tests(self, prompt: str, context: Dict[str, Any]) -> Tuple[str, str]:
         if not self.available:
             raise RuntimeError("Local LLM provider not available")
 
-        prompt = f"""Generate comprehensive pytest tests for this Python code:
-
-```python
-{code}
-```
-
-Context: {json.dumps(context)}
-
-Requirements:
-1. Use pytest framework with async support (@pytest.mark.asyncio)
-2. Test happy path, edge cases, and error conditions
-3. Mock external dependencies (files, network, databases)
-4. Include setup/teardown with fixtures
-5. Use descriptive test names (test_function_name_scenario)
-6. Add docstrings to each test
-7. Return ONLY the test code in pytest format
-
-Example format:
-```python
-import pytest
-from unittest.mock import AsyncMock, MagicMock
-
-@pytest.mark.asyncio
-async def test_my_function_success():
-    '''Test successful execution'''
-    result = await my_function("test")
-    assert result["success"] is True
-```
-
-Generate the pytest test code:"""
+        full_prompt = f"{FUSED_SYSTEM_PROMPT}\n\nContext:\n{_json_text(context, indent=True)}\n\nTask: {prompt}"
+
+        # Ollama's JSON mode constrains decoding to a parseable object
+        payload = {
+            "model": self.model,
+            "prompt": full_prompt,
+            "stream": True,
+            "format": "json",
+            "options": {
+                "temperature": 0.2,
+                "top_p": 0.9,
+                "num_predict": 3500,
+            }
+        }
 
         try:
-            response = await self.client.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "top_p": 0.9,
-                        "num_predict": 1500,
-                    }
-                }
-            )
-            response.raise_for_status()
-
-            generated = response.json()["response"].strip()
-
-            # Clean up markdown
-            if "```python" in generated:
-                parts = generated.split("```python")
-                if len(parts) > 1:
-                    code = parts[1].split("```")[0].strip()
-                    return code
-            elif "```" in generated:
-                parts = generated.split("```")
-                if len(parts) >= 3:
-                    return parts[1].strip()
-
-            return generated
-
-        except Exception as e:
-            logger.error(f"Local LLM test generation failed: {e}")
-            # Fallback to simpler model
-            if "qwen" in self.model.lower():
-                logger.info("Retrying test generation with fallback model...")
-                self.model = "codellama"
-                return await self.generate_tests(code, context)
-            raise
+            reply = await self._generate(payload)
+        except _transport_errors() as e:
+            logger.error(f"Local LLM fused generation failed: {e}")
+            if "qwen" not in self.model.lower():
+                raise
+            # Retry this call on a simpler model; the provider keeps its own
+            logger.info("Retrying fused generation with fallback model...")
+            reply = await self._generate({**payload, "model": "codellama"})
+
+        # Malformed or truncated replies raise ValueError for the caller,
+        # which falls back to separate code and test calls
+        return _parse_code_and_tests(reply)
 
     async def chat(self, prompt: str, context: Dict[str, Any]) -> str:
         if not self.available:
@@ -440,21 +653,16 @@ Generate the pytest test code:"""
         full_prompt = f"{system_prompt}\n\nUser: {prompt}\n\nAssistant:"
 
         try:
-            response = await self.client.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": full_prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.7,
-                        "top_p": 0.9,
-                        "num_predict": 1000,
-                    }
+            return await self._generate({
+                "model": self.model,
+                "prompt": full_prompt,
+                "stream": False,
+                "options": {
+                    "temperature": 0.7,
+                    "top_p": 0.9,
+                    "num_predict": 1000,
                 }
-            )
-            response.raise_for_status()
-            return response.json()["response"].strip()
+            })
         except Exception as e:
             logger.error(f"Local LLM chat failed: {e}")
             return f"Error communicating with local mind: {e}"
@@ -469,7 +677,7 @@ Generate the pytest test code:"""
 {code}
 ```
 
-Context: {json.dumps(context)}
+Context: {_json_text(context)}
 
 Requirements:
 1. Use pytest framework with async support (@pytest.mark.asyncio)
@@ -495,35 +703,19 @@ async def test_my_function_success():
 Generate the pytest test code:"""
 
         try:
-            response = await self.client.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "top_p": 0.9,
-                        "num_predict": 1500,
-                    }
+            generated = await self._generate({
+                "model": self.model,
+                "prompt": prompt,
+                "stream": True,
+                "options": {
+                    "temperature": 0.3,
+                    "top_p": 0.9,
+                    "num_predict": 1500,
                 }
-            )
-            response.raise_for_status()
-
-            generated = response.json()["response"].strip()
+            }, stop_at_fence=True)
 
             # Clean up markdown
-            if "```python" in generated:
-                parts = generated.split("```python")
-                if len(parts) > 1:
-                    code = parts[1].split("```")[0].strip()
-                    return code
-            elif "```" in generated:
-                parts = generated.split("```")
-                if len(parts) >= 3:
-                    return parts[1].strip()
-
-            return generated
+            return _strip_fences(generated)
 
         except Exception as e:
             logger.error(f"Local LLM test generation failed: {e}")
@@ -538,10 +730,68 @@ Generate the pytest test code:"""
 class CodeGenerator:
     """AI-powered code generation with self-healing and rollback"""
 
+    # One scan over the code reports every quality marker it contains.
+    # The lookahead keeps matches zero-width so markers never mask each other.
+    _HEURISTICS_RE = re.compile(
+        r"(?=(?P<type>: |->)"
+        r"|(?P<err>try:|except)"
+        r"|(?P<log>logger\.|logging\.)"
+        r"|(?P<doc>\"{3}|'{3}))"
+    )
+
+    # Substrings that make generated code high risk; extend via register_risk_pattern
+    HIGH_RISK_PATTERNS: List[str] = [
+        'os.system', 'subprocess.call', 'eval(', 'exec(', '__import__',
+        'pickle.loads', 'marshal.loads',
+    ]
+    _risk_matcher: Optional[Callable] = None
+
+    # Max distinct (model, prompt, context) generations kept in memory
+    GEN_CACHE_SIZE = 512
+    # Anything shorter than this cannot be a useful patch
+    MIN_CODE_LENGTH = 32
+
     def __init__(self, provider: Optional[LLMProvider] = None):
         self.provider = provider or self._get_default_provider()
         self.patch_history: List[PatchResult] = []
-        self.successful_patterns: Dict[str, List[str]] = {}
+        # Running totals over patch_history so stats never rescan it
+        self._success_count = 0
+        self._total_execution_time = 0.0
+        # Last 10 successful patch checksums per category
+        self.successful_patterns: Dict[str, Deque[str]] = defaultdict(
+            lambda: deque(maxlen=10))
+        # LRU of generation futures; concurrent duplicates share one model call
+        self._gen_cache: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+        self._test_pool = self._new_test_pool()
+        # Patch/test files live for the generator's lifetime, on tmpfs when available
+        self._tmpdir = tempfile.TemporaryDirectory(
+            prefix="chimera_patch_",
+            dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+    @staticmethod
+    def _new_test_pool() -> ProcessPoolExecutor:
+        """Pool of pre-warmed pytest workers
+
+        Each worker runs one test file and is then replaced, so untrusted
+        tests never share interpreter state; the replacement starts (and
+        imports pytest) while the pool is idle, off the request path.
+        """
+        return ProcessPoolExecutor(
+            max_workers=int(os.getenv("CHIMERA_TEST_WORKERS", "2")),
+            initializer=_preimport,
+            max_tasks_per_child=1)
+
+    def _reset_test_pool(self):
+        """Kill the pytest workers and start a fresh pool
+
+        A hung test cannot be cancelled from the event loop, so its worker is
+        killed instead; tests still running in the old pool fail with it.
+        """
+        pool, self._test_pool = self._test_pool, self._new_test_pool()
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.kill()
 
     def _get_default_provider(self) -> LLMProvider:
         """Auto-detect available LLM provider"""
@@ -580,22 +830,51 @@ class CodeGenerator:
             return None
 
         try:
-            # Generate code
             logger.info(f"Generating code for: {problem_description}")
-            code = await self.provider.generate_code(problem_description, context)
-
-            # Clean up code (remove markdown fences if present)
-            code = self._clean_code(code)
+            code = test_code = None
 
-            # Generate tests if requested
-            test_code = None
+            # Code and tests from one model call when the provider supports it
             if include_tests:
-                logger.info("Generating tests for generated code")
-                test_code = await self.provider.generate_tests(code, context)
-                test_code = self._clean_code(test_code)
+                try:
+                    code, test_code = await self._generate_cached(
+                        "code+tests", problem_description, context,
+                        self.provider.generate_code_and_tests)
+                    code = self._clean_code(code)
+                    test_code = self._clean_code(test_code)
+                except Exception as e:
+                    logger.debug(f"Fused generation failed ({e}), using separate calls")
+                else:
+                    if not self._is_valid_code(code):
+                        logger.warning("Generated code is empty or invalid, discarding patch")
+                        self._evict_cached("code+tests", problem_description, context)
+                        return None
+                    if not self._is_valid_code(test_code):
+                        logger.warning("Generated tests are invalid, dropping them")
+                        test_code = None
+
+            if code is None:
+                # Generate code
+                code = await self._generate_cached(
+                    "code", problem_description, context, self.provider.generate_code)
+
+                # Clean up code (remove markdown fences if present)
+                code = self._clean_code(code)
+
+                # Don't spend a test-generation call on unusable code
+                if not self._is_valid_code(code):
+                    logger.warning("Generated code is empty or invalid, skipping tests")
+                    self._evict_cached("code", problem_description, context)
+                    return None
+
+                # Generate tests if requested
+                if include_tests:
+                    logger.info("Generating tests for generated code")
+                    test_code = await self.provider.generate_tests(code, context)
+                    test_code = self._clean_code(test_code)
 
             # Calculate confidence based on code quality metrics
-            confidence = self._calculate_confidence(code, test_code)
+            flags = self._scan_heuristics(code)
+            confidence = self._calculate_confidence(code, test_code, flags)
 
             # Determine risk level
             risk_level = self._assess_risk(code, context)
@@ -616,37 +895,83 @@ class CodeGenerator:
             logger.error(f"Failed to generate patch: {e}")
             return None
 
-    def _clean_code(self, code: str) -> str:
-        """Remove markdown fences and clean up generated code"""
-        lines = code.split('\n')
+    async def _generate_cached(
+        self,
+        kind: str,
+        prompt: str,
+        context: Dict[str, Any],
+        generate: Callable[[str, Dict[str, Any]], Awaitable[Any]]
+    ) -> Any:
+        """Run a generation, reusing the result of an identical earlier or in-flight request"""
+        key = self._cache_key(kind, prompt, context)
+
+        future = self._gen_cache.get(key)
+        if future is not None:
+            self._gen_cache.move_to_end(key)
+            logger.debug("Generation cache hit")
+            # Shield so one cancelled waiter does not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._gen_cache[key] = future
+        if len(self._gen_cache) > self.GEN_CACHE_SIZE:
+            self._gen_cache.popitem(last=False)
+
+        try:
+            result = await generate(prompt, context)
+        except BaseException as e:
+            # Never cache failures; hand the error to anyone already waiting
+            self._gen_cache.pop(key, None)
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody else waits
+            raise
 
-        # Remove markdown code fences
-        if lines and lines[0].strip().startswith('```'):
-            lines = lines[1:]
-        if lines and lines[-1].strip().startswith('```'):
-            lines = lines[:-1]
+        future.set_result(result)
+        return result
 
-        return '\n'.join(lines).strip()
+    def _cache_key(self, kind: str, prompt: str, context: Dict[str, Any]) -> str:
+        """Stable key for a generation request"""
+        model = getattr(self.provider, "model", "")
+        return _code_hasher(
+            f"{kind}|{model}|{prompt}|{_json_text(context, sort_keys=True)}".encode()
+        ).hexdigest()
 
-    def _calculate_confidence(self, code: str, test_code: Optional[str]) -> float:
-        """Calculate confidence score for generated code"""
-        confidence = 0.5  # Base confidence
+    def _evict_cached(self, kind: str, prompt: str, context: Dict[str, Any]):
+        """Forget a cached generation so the next request asks the model again"""
+        self._gen_cache.pop(self._cache_key(kind, prompt, context), None)
+
+    def _is_valid_code(self, code: Optional[str]) -> bool:
+        """Cheap sanity check: non-trivial and syntactically valid Python"""
+        if not code or len(code) < self.MIN_CODE_LENGTH:
+            return False
+        try:
+            ast.parse(code)
+        except SyntaxError:
+            return False
+        return True
 
-        # Check for type hints
-        if ': ' in code or '->' in code:
-            confidence += 0.1
+    def _clean_code(self, code: str) -> str:
+        """Remove markdown fences and clean up generated code"""
+        return _strip_fences(code)
 
-        # Check for error handling
-        if 'try:' in code or 'except' in code:
-            confidence += 0.1
+    def _scan_heuristics(self, code: str) -> Set[str]:
+        """Collect the heuristic markers present in code in a single pass"""
+        return {m.lastgroup for m in self._HEURISTICS_RE.finditer(code)}
 
-        # Check for logging
-        if 'logger.' in code or 'logging.' in code:
-            confidence += 0.05
+    def _calculate_confidence(self, code: str, test_code: Optional[str],
+                              flags: Optional[Set[str]] = None) -> float:
+        """Calculate confidence score for generated code"""
+        if flags is None:
+            flags = self._scan_heuristics(code)
 
-        # Check for docstrings
-        if '"""' in code or "'''" in code:
-            confidence += 0.05
+        confidence = 0.5  # Base confidence
+        confidence += 0.1 * ('type' in flags)  # Type hints
+        confidence += 0.1 * ('err' in flags)   # Error handling
+        confidence += 0.05 * ('log' in flags)  # Logging
+        confidence += 0.05 * ('doc' in flags)  # Docstrings
 
         # Bonus for tests
         if test_code:
@@ -654,12 +979,32 @@ class CodeGenerator:
 
         return min(confidence, 1.0)
 
+    @classmethod
+    def register_risk_pattern(cls, pattern: str) -> None:
+        """Add a high-risk substring; the matcher is rebuilt on next use"""
+        if pattern not in cls.HIGH_RISK_PATTERNS:
+            cls.HIGH_RISK_PATTERNS.append(pattern)
+            cls._risk_matcher = None
+
+    @classmethod
+    def _get_risk_matcher(cls) -> Callable:
+        """Build (once) a function yielding high-risk matches in a string"""
+        if cls._risk_matcher is None:
+            if AHOCORASICK_AVAILABLE:
+                automaton = ahocorasick.Automaton()
+                for pattern in cls.HIGH_RISK_PATTERNS:
+                    automaton.add_word(pattern, pattern)
+                automaton.make_automaton()
+                cls._risk_matcher = automaton.iter
+            else:
+                cls._risk_matcher = re.compile(
+                    "|".join(map(re.escape, cls.HIGH_RISK_PATTERNS))).finditer
+        return cls._risk_matcher
+
     def _assess_risk(self, code: str, context: Dict[str, Any]) -> str:
         """Assess risk level of generated code"""
-        # High risk indicators
-        high_risk_patterns = ['os.system',
-                              'subprocess.call', 'eval(', 'exec(', '__import__']
-        if any(pattern in code for pattern in high_risk_patterns):
+        # High risk indicators (stop at the first hit)
+        if next(self._get_risk_matcher()(code), None) is not None:
             return "high"
 
         # Low risk indicators
@@ -683,32 +1028,31 @@ class CodeGenerator:
                 error="No tests available"
             )
 
-        # Create temporary test file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='_patch.py', delete=False) as f:
-            f.write(patch.code)
-            code_file = f.name
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='_test.py', delete=False) as f:
-            # Add imports if not present
-            test_code = patch.test_code
-            if 'import pytest' not in test_code:
-                test_code = 'import pytest\n' + test_code
-            f.write(test_code)
-            test_file = f.name
+        # Files are named by content hash: identical content maps to the same
+        # file, which is never stale for the warm workers' module cache
+        test_code = patch.test_code
+        if 'import pytest' not in test_code:
+            test_code = 'import pytest\n' + test_code
+        test_key = _code_hasher(test_code.encode()).hexdigest()[:12]
+
+        code_path = Path(self._tmpdir.name, f"patch_{patch.checksum[:12]}.py")
+        test_path = Path(self._tmpdir.name, f"test_{test_key}.py")
+        if not code_path.exists():
+            code_path.write_text(patch.code)
+        if not test_path.exists():
+            test_path.write_text(test_code)
+        test_file = str(test_path)
 
         try:
-            # Run pytest on the test file
-            result = subprocess.run(
-                ['python', '-m', 'pytest', test_file, '-v', '--tb=short'],
-                capture_output=True,
-                text=True,
+            # Run pytest on the test file in a warm worker process
+            loop = asyncio.get_running_loop()
+            returncode, output = await asyncio.wait_for(
+                loop.run_in_executor(self._test_pool, _run_pytest, test_file),
                 timeout=timeout
             )
 
             execution_time = time.time() - start_time
-            success = result.returncode == 0
-
-            output = result.stdout + result.stderr
+            success = returncode == 0
 
             logger.info(
                 f"Patch test {'PASSED' if success else 'FAILED'} in {execution_time:.2f}s")
@@ -723,6 +1067,8 @@ class CodeGenerator:
 
             # Store result in history
             self.patch_history.append(patch_result)
+            self._success_count += success
+            self._total_execution_time += execution_time
 
             # Learn from successful patches
             if success:
@@ -730,7 +1076,8 @@ class CodeGenerator:
 
             return patch_result
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
+            self._reset_test_pool()
             return PatchResult(
                 success=False,
                 patch=patch,
@@ -746,24 +1093,17 @@ class CodeGenerator:
                 execution_time=time.time() - start_time,
                 error=str(e)
             )
-        finally:
-            # Cleanup temp files
-            Path(code_file).unlink(missing_ok=True)
-            Path(test_file).unlink(missing_ok=True)
+
+    def close(self):
+        """Shut down the pytest worker pool and remove temporary patch files"""
+        self._test_pool.shutdown(wait=False, cancel_futures=True)
+        self._tmpdir.cleanup()
 
     def _learn_from_success(self, patch: CodePatch):
         """Learn patterns from successful patches"""
         category = patch.description[:50]  # Use first 50 chars as category
-
-        if category not in self.successful_patterns:
-            self.successful_patterns[category] = []
-
         self.successful_patterns[category].append(patch.checksum)
 
-        # Keep only last 10 successful patterns per category
-        if len(self.successful_patterns[category]) > 10:
-            self.successful_patterns[category] = self.successful_patterns[category][-10:]
-
     async def apply_with_rollback(
         self,
         patch: CodePatch,
@@ -829,16 +1169,16 @@ class CodeGenerator:
         if not self.patch_history:
             return 0.0
 
-        successful = sum(1 for r in self.patch_history if r.success)
-        return successful / len(self.patch_history)
+        return self._success_count / len(self.patch_history)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get code generation statistics"""
+        total = len(self.patch_history)
         return {
-            "total_patches": len(self.patch_history),
-            "successful_patches": sum(1 for r in self.patch_history if r.success),
+            "total_patches": total,
+            "successful_patches": self._success_count,
             "success_rate": self.get_success_rate(),
-            "avg_execution_time": sum(r.execution_time for r in self.patch_history) / len(self.patch_history) if self.patch_history else 0,
+            "avg_execution_time": self._total_execution_time / total if total else 0,
             "learned_patterns": sum(len(patterns) for patterns in self.successful_patterns.values()),
             "provider": type(self.provider).__name__ if self.provider else "None"
         }
@@ -6,17 +6,28 @@ AI that literally rewrites its own source code for performance optimization.
 import ast
 import asyncio
 import hashlib
+import multiprocessing
+import os
+import pickle
+import queue
 import time
-import tempfile
+import types
 import shutil
+from collections import OrderedDict, deque
+from itertools import islice
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 import logging
 import subprocess
 import sys
 
+import numpy as np
+
 logger = logging.getLogger("chimera.neural_evolution")
 
 
@@ -43,6 +54,8 @@ class PerformanceMetric:
     success_rate: float
     throughput: float
     timestamp: float = field(default_factory=time.time)
+    median_time: float = 0.0
+    stddev_time: float = 0.0
 
 
 @dataclass
@@ -57,240 +70,251 @@ class EvolutionResult:
     rollback_reason: Optional[str] = None
 
 
+@lru_cache(maxsize=64)
+def _parse_cached(source_code: str) -> ast.AST:
+    """Parse source once per distinct text; detectors only read the tree"""
+    return ast.parse(source_code)
+
+
+# Subtree properties reported bottom-up by _OpportunityVisitor
+_HAS_ARITHMETIC = 1
+_HAS_IO = 2
+_HAS_GLOBAL = 4
+
+_IO_ATTRS = frozenset({'write', 'read', 'open', 'print'})
+_BLOCKING_ATTRS = frozenset({'sleep', 'read', 'write', 'get', 'post', 'request'})
+
+# Findings are reported grouped in this order before the priority sort
+_OPPORTUNITY_TYPES = (
+    'loop_vectorization',
+    'function_memoization',
+    'async_opportunities',
+    'algorithm_complexity',
+    'redundant_operations',
+)
+
+
+class _OpportunityVisitor(ast.NodeVisitor):
+    """Collects every optimization finding for one function in a single walk.
+
+    Each visit returns a bitmask of what its subtree contains, so loop
+    arithmetic and function purity are known without re-walking. Nested
+    functions, lambdas and classes are their own scopes and report nothing
+    to the enclosing one. Memoization
+    looks at every definition of the target; the other detectors ignore the
+    bodies of other functions (loop vectorization also of other async ones).
+    """
+
+    def __init__(self, target_func: str):
+        self.target_func = target_func
+        self.other_defs = 0         # depth inside non-target sync functions
+        self.other_async_defs = 0   # depth inside non-target async functions
+        self.in_target = False      # inside the sync target
+        self.in_any_target = False  # inside the sync or async target
+        self.loop_depth = 0
+        self.expressions = []
+        self.findings = {opp_type: [] for opp_type in _OPPORTUNITY_TYPES}
+
+    def visit(self, node):
+        # Dispatch on node type directly instead of building 'visit_' + name per node
+        return _VISIT_DISPATCH.get(node.__class__, _OpportunityVisitor.generic_visit)(self, node)
+
+    def generic_visit(self, node):
+        mask = 0
+        dispatch = _VISIT_DISPATCH.get
+        generic = _OpportunityVisitor.generic_visit
+        for child in ast.iter_child_nodes(node):
+            mask |= dispatch(child.__class__, generic)(self, child)
+        return mask
+
+    def visit_FunctionDef(self, node):
+        if node.name != self.target_func:
+            self.other_defs += 1
+            self.generic_visit(node)
+            self.other_defs -= 1
+            return 0
+
+        live = self.other_defs == 0
+        loop_live = live and self.other_async_defs == 0
+        memo = self.findings['function_memoization']
+        slot = len(memo)
+        memo.append(None)
+
+        if loop_live:
+            self.in_any_target = True
+        if live:
+            self.in_target = True
+        mask = self.generic_visit(node)
+        if loop_live:
+            self.in_any_target = False
+        if live:
+            self.in_target = False
+            self._flush_redundancy()
+
+        # Pure if nothing in the body does I/O or touches globals
+        if not mask & (_HAS_IO | _HAS_GLOBAL):
+            memo[slot] = {
+                'type': 'function_memoization',
+                'line': node.lineno,
+                'description': 'Pure function can be memoized with LRU cache',
+                'priority': 7,
+                'estimated_speedup': 3.0,
+                'risk': 'low'
+            }
+        return 0
+
+    def visit_AsyncFunctionDef(self, node):
+        if node.name != self.target_func:
+            self.other_async_defs += 1
+            self.generic_visit(node)
+            self.other_async_defs -= 1
+            return 0
+
+        loop_live = self.other_defs == 0 and self.other_async_defs == 0
+        if loop_live:
+            self.in_any_target = True
+        self.generic_visit(node)
+        if loop_live:
+            self.in_any_target = False
+        return 0
+
+    def visit_Lambda(self, node):
+        self.generic_visit(node)
+        return 0
+
+    def visit_ClassDef(self, node):
+        self.generic_visit(node)
+        return 0
+
+    def visit_For(self, node):
+        loops = self.findings['loop_vectorization']
+        slot = None
+        if self.in_any_target and self.other_defs == 0 and self.other_async_defs == 0:
+            slot = len(loops)
+            loops.append(None)
+
+        counted = self.in_target and self.other_defs == 0
+        if counted:
+            self.loop_depth += 1
+            if self.loop_depth >= 2:
+                self.findings['algorithm_complexity'].append({
+                    'type': 'algorithm_complexity',
+                    'line': node.lineno,
+                    'description': f'Nested loop depth {self.loop_depth} - O(n^{self.loop_depth}) complexity',
+                    'priority': 10,
+                    'estimated_speedup': self.loop_depth * 5.0,
+                    'risk': 'high'
+                })
+
+        mask = self.generic_visit(node)
+        if counted:
+            self.loop_depth -= 1
+
+        # Loop body has arithmetic operations
+        if slot is not None and mask & _HAS_ARITHMETIC:
+            loops[slot] = {
+                'type': 'loop_vectorization',
+                'line': node.lineno,
+                'description': 'Loop with arithmetic can be vectorized with NumPy',
+                'priority': 8,
+                'estimated_speedup': 5.0,
+                'risk': 'low'
+            }
+        return mask
+
+    def visit_Call(self, node):
+        mask = 0
+        if isinstance(node.func, ast.Attribute):
+            attr = node.func.attr
+            if attr in _IO_ATTRS:
+                mask = _HAS_IO
+            # Detect blocking I/O operations
+            if attr in _BLOCKING_ATTRS and self.in_target and self.other_defs == 0:
+                self.findings['async_opportunities'].append({
+                    'type': 'async_opportunities',
+                    'line': node.lineno,
+                    'description': f'Blocking call to {attr} can be async',
+                    'priority': 9,
+                    'estimated_speedup': 10.0,
+                    'risk': 'medium'
+                })
+        return mask | self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        if self.in_target and self.other_defs == 0 and isinstance(node.value, ast.BinOp):
+            self.expressions.append((ast.unparse(node.value), node.lineno))
+        return self.generic_visit(node)
+
+    def visit_BinOp(self, node):
+        return _HAS_ARITHMETIC | self.generic_visit(node)
+
+    def visit_UnaryOp(self, node):
+        return _HAS_ARITHMETIC | self.generic_visit(node)
+
+    def visit_Global(self, node):
+        return _HAS_GLOBAL
+
+    def _flush_redundancy(self):
+        # Check for duplicate expressions
+        seen = {}
+        for expr, line in self.expressions:
+            if expr in seen:
+                self.findings['redundant_operations'].append({
+                    'type': 'redundant_operations',
+                    'line': line,
+                    'description': f'Duplicate expression also at line {seen[expr]}',
+                    'priority': 6,
+                    'estimated_speedup': 1.5,
+                    'risk': 'low'
+                })
+            else:
+                seen[expr] = line
+
+    def opportunities(self) -> List[Dict[str, Any]]:
+        return [finding
+                for opp_type in _OPPORTUNITY_TYPES
+                for finding in self.findings[opp_type]
+                if finding is not None]
+
+
+_VISIT_DISPATCH = {
+    getattr(ast, name[len('visit_'):]): method
+    for name, method in vars(_OpportunityVisitor).items()
+    if name.startswith('visit_')
+}
+
+
 class CodeAnalyzer:
     """Analyzes code for optimization opportunities"""
 
-    def __init__(self):
-        self.optimization_patterns = {
-            "loop_vectorization": self._detect_vectorizable_loops,
-            "function_memoization": self._detect_cacheable_functions,
-            "async_opportunities": self._detect_async_opportunities,
-            "algorithm_complexity": self._detect_inefficient_algorithms,
-            "redundant_operations": self._detect_redundant_code,
-        }
-
     def analyze_function(self, source_code: str, function_name: str) -> List[Dict[str, Any]]:
         """Analyze a function for optimization opportunities"""
         try:
-            tree = ast.parse(source_code)
-            opportunities = []
+            tree = _parse_cached(source_code)
 
-            for pattern_name, detector in self.optimization_patterns.items():
-                findings = detector(tree, function_name)
-                if findings:
-                    opportunities.extend(findings)
+            visitor = _OpportunityVisitor(function_name)
+            visitor.visit(tree)
 
-            return sorted(opportunities, key=lambda x: x['priority'], reverse=True)
+            return sorted(visitor.opportunities(), key=lambda x: x['priority'], reverse=True)
 
         except SyntaxError as e:
             logger.error(f"Syntax error analyzing {function_name}: {e}")
             return []
 
-    def _detect_vectorizable_loops(self, tree: ast.AST, target_func: str) -> List[Dict]:
-        """Detect loops that can be vectorized with NumPy"""
-        opportunities = []
-
-        class LoopVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.in_target_func = False
-                self.findings = []
-
-            def visit_FunctionDef(self, node):
-                if node.name == target_func:
-                    self.in_target_func = True
-                    self.generic_visit(node)
-                    self.in_target_func = False
-
-            def visit_AsyncFunctionDef(self, node):
-                if node.name == target_func:
-                    self.in_target_func = True
-                    self.generic_visit(node)
-                    self.in_target_func = False
-
-            def visit_For(self, node):
-                if self.in_target_func:
-                    # Check if loop body has arithmetic operations
-                    has_arithmetic = any(isinstance(n, (ast.BinOp, ast.UnaryOp))
-                                         for n in ast.walk(node))
-
-                    if has_arithmetic:
-                        self.findings.append({
-                            'type': 'loop_vectorization',
-                            'line': node.lineno,
-                            'description': 'Loop with arithmetic can be vectorized with NumPy',
-                            'priority': 8,
-                            'estimated_speedup': 5.0,
-                            'risk': 'low'
-                        })
-
-                self.generic_visit(node)
-
-        visitor = LoopVisitor()
-        visitor.visit(tree)
-        return visitor.findings
-
-    def _detect_cacheable_functions(self, tree: ast.AST, target_func: str) -> List[Dict]:
-        """Detect pure functions that can be memoized"""
-        opportunities = []
-
-        class CacheVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.findings = []
-
-            def visit_FunctionDef(self, node):
-                if node.name == target_func:
-                    # Check if function has no side effects
-                    has_io = any(isinstance(n, ast.Call) and
-                                 isinstance(n.func, ast.Attribute) and
-                                 n.func.attr in (
-                                     'write', 'read', 'open', 'print')
-                                 for n in ast.walk(node))
-
-                    has_globals = any(isinstance(n, ast.Global)
-                                      for n in ast.walk(node))
-
-                    if not has_io and not has_globals:
-                        self.findings.append({
-                            'type': 'function_memoization',
-                            'line': node.lineno,
-                            'description': 'Pure function can be memoized with LRU cache',
-                            'priority': 7,
-                            'estimated_speedup': 3.0,
-                            'risk': 'low'
-                        })
-
-                self.generic_visit(node)
-
-        visitor = CacheVisitor()
-        visitor.visit(tree)
-        return visitor.findings
-
-    def _detect_async_opportunities(self, tree: ast.AST, target_func: str) -> List[Dict]:
-        """Detect synchronous I/O that can be made async"""
-        opportunities = []
-
-        class AsyncVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.in_target_func = False
-                self.findings = []
-
-            def visit_FunctionDef(self, node):
-                # Only analyze sync functions (async already optimized)
-                if node.name == target_func:
-                    self.in_target_func = True
-                    self.generic_visit(node)
-                    self.in_target_func = False
-
-            def visit_Call(self, node):
-                if self.in_target_func:
-                    # Detect blocking I/O operations
-                    blocking_ops = ['sleep', 'read',
-                                    'write', 'get', 'post', 'request']
-
-                    if isinstance(node.func, ast.Attribute):
-                        if node.func.attr in blocking_ops:
-                            self.findings.append({
-                                'type': 'async_opportunities',
-                                'line': node.lineno,
-                                'description': f'Blocking call to {node.func.attr} can be async',
-                                'priority': 9,
-                                'estimated_speedup': 10.0,
-                                'risk': 'medium'
-                            })
-
-                self.generic_visit(node)
-
-        visitor = AsyncVisitor()
-        visitor.visit(tree)
-        return visitor.findings
-
-    def _detect_inefficient_algorithms(self, tree: ast.AST, target_func: str) -> List[Dict]:
-        """Detect nested loops and inefficient algorithms"""
-        opportunities = []
-
-        class ComplexityVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.in_target_func = False
-                self.loop_depth = 0
-                self.findings = []
-
-            def visit_FunctionDef(self, node):
-                if node.name == target_func:
-                    self.in_target_func = True
-                    self.generic_visit(node)
-                    self.in_target_func = False
 
-            def visit_For(self, node):
-                if self.in_target_func:
-                    self.loop_depth += 1
-
-                    if self.loop_depth >= 2:
-                        self.findings.append({
-                            'type': 'algorithm_complexity',
-                            'line': node.lineno,
-                            'description': f'Nested loop depth {self.loop_depth} - O(n^{self.loop_depth}) complexity',
-                            'priority': 10,
-                            'estimated_speedup': self.loop_depth * 5.0,
-                            'risk': 'high'
-                        })
-
-                    self.generic_visit(node)
-                    self.loop_depth -= 1
-                else:
-                    self.generic_visit(node)
-
-        visitor = ComplexityVisitor()
-        visitor.visit(tree)
-        return visitor.findings
-
-    def _detect_redundant_code(self, tree: ast.AST, target_func: str) -> List[Dict]:
-        """Detect duplicate code that can be refactored"""
-        opportunities = []
-
-        class RedundancyVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.in_target_func = False
-                self.expressions = []
-                self.findings = []
-
-            def visit_FunctionDef(self, node):
-                if node.name == target_func:
-                    self.in_target_func = True
-                    self.generic_visit(node)
-                    self.in_target_func = False
-
-                    # Check for duplicate expressions
-                    seen = {}
-                    for expr, line in self.expressions:
-                        if expr in seen:
-                            self.findings.append({
-                                'type': 'redundant_operations',
-                                'line': line,
-                                'description': f'Duplicate expression also at line {seen[expr]}',
-                                'priority': 6,
-                                'estimated_speedup': 1.5,
-                                'risk': 'low'
-                            })
-                        else:
-                            seen[expr] = line
-
-            def visit_Assign(self, node):
-                if self.in_target_func and isinstance(node.value, ast.BinOp):
-                    expr = ast.unparse(node.value)
-                    self.expressions.append((expr, node.lineno))
-
-                self.generic_visit(node)
-
-        visitor = RedundancyVisitor()
-        visitor.visit(tree)
-        return visitor.findings
+# Confidence deduction per opportunity risk level
+_RISK_PENALTY = {'low': 0.0, 'medium': 0.1, 'high': 0.3}
 
 
 class CodeOptimizer:
     """Generates optimized code variants"""
 
+    VARIANT_CACHE_SIZE = 256
+
     def __init__(self, analyzer: CodeAnalyzer):
         self.analyzer = analyzer
+        # (source digest, function, type, line) -> generated code, LRU-ordered
+        self._variant_cache: "OrderedDict[tuple, str]" = OrderedDict()
 
     def generate_variant(self, source_code: str, function_name: str,
                          opportunity: Dict[str, Any]) -> Optional[CodeVariant]:
@@ -311,7 +335,16 @@ class CodeOptimizer:
             return None
 
         try:
-            optimized_code = generator(source_code, function_name, opportunity)
+            key = (hashlib.blake2b(source_code.encode(), digest_size=16).digest(),
+                   function_name, opt_type, opportunity.get('line'))
+            optimized_code = self._variant_cache.get(key)
+            if optimized_code is None:
+                optimized_code = generator(source_code, function_name, opportunity)
+                self._variant_cache[key] = optimized_code
+                if len(self._variant_cache) > self.VARIANT_CACHE_SIZE:
+                    self._variant_cache.popitem(last=False)
+            else:
+                self._variant_cache.move_to_end(key)
 
             if optimized_code and optimized_code != source_code:
                 variant_id = hashlib.sha256(
@@ -342,6 +375,7 @@ class CodeOptimizer:
             def __init__(self, target_func: str):
                 self.target_func = target_func
                 self.in_target = False
+                self.modified = False
 
             def visit_FunctionDef(self, node):
                 if node.name == self.target_func:
@@ -356,12 +390,16 @@ class CodeOptimizer:
                 if self.in_target:
                     # Convert simple arithmetic loops to numpy operations
                     # This is a placeholder - real implementation would be more sophisticated
+                    # (and must set self.modified when it rewrites the loop)
                     return node
                 return node
 
         transformer = VectorizeTransformer(func_name)
         new_tree = transformer.visit(tree)
 
+        # Nothing rewritten: skip the unparse round trip (it only reformats)
+        if not transformer.modified:
+            return source
         return ast.unparse(new_tree)
 
     def _add_memoization(self, source: str, func_name: str, opp: Dict) -> str:
@@ -371,6 +409,7 @@ class CodeOptimizer:
         class MemoizeTransformer(ast.NodeTransformer):
             def __init__(self, target_func: str):
                 self.target_func = target_func
+                self.modified = False
 
             def visit_FunctionDef(self, node):
                 if node.name == self.target_func:
@@ -382,12 +421,16 @@ class CodeOptimizer:
                         keywords=[]
                     )
                     node.decorator_list.insert(0, decorator)
+                    self.modified = True
 
                 return node
 
         transformer = MemoizeTransformer(func_name)
         new_tree = transformer.visit(tree)
 
+        if not transformer.modified:
+            return source
+
         # Add functools import
         optimized = "from functools import lru_cache\n\n" + \
             ast.unparse(new_tree)
@@ -443,81 +486,146 @@ class CodeOptimizer:
         priority = opportunity.get('priority', 5)
         risk = opportunity.get('risk', 'medium')
 
-        risk_penalty = {'low': 0.0, 'medium': 0.1, 'high': 0.3}.get(risk, 0.2)
+        risk_penalty = _RISK_PENALTY.get(risk, 0.2)
 
         confidence = (priority / 10.0) - risk_penalty
         return max(0.3, min(0.95, confidence))
 
 
+@lru_cache(maxsize=32)
+def _compile_variant(code: str):
+    """Compile variant source once per distinct text"""
+    return compile(code, "<variant>", "exec")
+
+
+async def _benchmark(code: str, function_name: str, test_inputs: List[Any],
+                     test_iterations: int, warmup_iterations: int) -> PerformanceMetric:
+    """Time function_name from code over test_inputs"""
+    # Build the module in memory; retries of the same variant reuse the code object
+    module = types.ModuleType("test_module")
+    exec(_compile_variant(code), module.__dict__)
+
+    func = getattr(module, function_name)
+    # Introspect once; the answer never changes inside the loops
+    is_coro = asyncio.iscoroutinefunction(func)
+
+    # Warmup; a raising input won't warm anything, so stop early
+    warm = True
+    for _ in range(warmup_iterations):
+        for test_input in test_inputs:
+            try:
+                if is_coro:
+                    await func(**test_input)
+                else:
+                    func(**test_input)
+            except Exception as e:
+                logger.debug(f"Warmup failed: {e}")
+                warm = False
+                break
+        if not warm:
+            break
+
+    # Actual benchmark
+    total_runs = test_iterations * len(test_inputs)
+    timings = np.empty(total_runs, dtype=np.float64)
+    perf_counter = time.perf_counter
+    idx = 0
+
+    for _ in range(test_iterations):
+        for test_input in test_inputs:
+            start = perf_counter()
+            try:
+                if is_coro:
+                    await func(**test_input)
+                else:
+                    func(**test_input)
+            except Exception as e:
+                logger.warning(f"Test failed: {e}")
+            else:
+                # Only successful calls are timed; instant failures would look fast
+                timings[idx] = perf_counter() - start
+                idx += 1
+
+    successes = idx
+    timings = timings[:successes]
+    avg_time = float(timings.mean()) if successes else float('inf')
+    success_rate = successes / total_runs
+
+    return PerformanceMetric(
+        execution_time=avg_time,
+        memory_usage=0.0,  # Placeholder
+        cpu_usage=0.0,  # Placeholder
+        success_rate=success_rate,
+        throughput=1.0 / avg_time if avg_time > 0 else 0.0,
+        median_time=float(np.median(timings)) if successes else float('inf'),
+        stddev_time=float(timings.std()) if successes else 0.0
+    )
+
+
+def _bench_sync(code: str, function_name: str, test_inputs: List[Any],
+                test_iterations: int, warmup_iterations: int) -> PerformanceMetric:
+    """Process-pool entry point: benchmark a variant on its own event loop"""
+    return asyncio.run(_benchmark(code, function_name, test_inputs,
+                                  test_iterations, warmup_iterations))
+
+
+def _pin_bench_worker(cores) -> None:
+    """Pool initializer: bind this benchmark worker to a core of its own"""
+    try:
+        os.sched_setaffinity(0, {cores.get_nowait()})
+    except (queue.Empty, OSError) as e:
+        logger.debug(f"Benchmark worker left unpinned: {e}")
+
+
 class PerformanceTester:
-    """A/B tests code variants"""
+    """A/B tests code variants
+
+    Variants are benchmarked in worker processes, so test_inputs must be
+    picklable; inputs that are not are benchmarked in-process instead.
+    """
 
-    def __init__(self):
+    def __init__(self, timeout: float = 300.0):
         self.test_iterations = 100
         self.warmup_iterations = 10
+        # Upper bound for both sides of one A/B test
+        self.timeout = timeout
+        self._bench_pool = self._new_bench_pool()
+
+    @staticmethod
+    def _new_bench_pool() -> ProcessPoolExecutor:
+        """Pool of benchmark workers
+
+        Benchmarks are CPU-bound. Both sides of an A/B test run at once only
+        when each worker can be pinned to a core of its own (Linux); otherwise
+        a single worker runs them one after the other so timings stay comparable.
+        """
+        cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+        if len(cores) >= 2:
+            core_queue = multiprocessing.Queue()
+            for core in cores[-2:]:
+                core_queue.put(core)
+            return ProcessPoolExecutor(
+                max_workers=2, initializer=_pin_bench_worker, initargs=(core_queue,))
+        return ProcessPoolExecutor(max_workers=1)
+
+    def _reset_bench_pool(self):
+        """Kill the benchmark workers and start a fresh pool
+
+        A variant that hangs cannot be cancelled from the event loop, and one
+        that kills its worker breaks the whole pool; either way the next A/B
+        test needs new workers.
+        """
+        pool, self._bench_pool = self._bench_pool, self._new_bench_pool()
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.kill()
 
     async def benchmark_variant(self, code: str, function_name: str,
                                 test_inputs: List[Any]) -> PerformanceMetric:
         """Benchmark a code variant"""
-
-        # Create temporary module
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_path = f.name
-
-        try:
-            # Import and test
-            import importlib.util
-            spec = importlib.util.spec_from_file_location(
-                "test_module", temp_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            func = getattr(module, function_name)
-
-            # Warmup
-            for _ in range(self.warmup_iterations):
-                for test_input in test_inputs:
-                    try:
-                        if asyncio.iscoroutinefunction(func):
-                            await func(**test_input)
-                        else:
-                            func(**test_input)
-                    except:
-                        pass
-
-            # Actual benchmark
-            timings = []
-            successes = 0
-
-            for _ in range(self.test_iterations):
-                for test_input in test_inputs:
-                    start = time.perf_counter()
-                    try:
-                        if asyncio.iscoroutinefunction(func):
-                            await func(**test_input)
-                        else:
-                            func(**test_input)
-                        successes += 1
-                    except Exception as e:
-                        logger.warning(f"Test failed: {e}")
-
-                    timings.append(time.perf_counter() - start)
-
-            avg_time = sum(timings) / len(timings) if timings else float('inf')
-            success_rate = successes / \
-                (self.test_iterations * len(test_inputs))
-
-            return PerformanceMetric(
-                execution_time=avg_time,
-                memory_usage=0.0,  # Placeholder
-                cpu_usage=0.0,  # Placeholder
-                success_rate=success_rate,
-                throughput=1.0 / avg_time if avg_time > 0 else 0.0
-            )
-
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        return await _benchmark(code, function_name, test_inputs,
+                                self.test_iterations, self.warmup_iterations)
 
     async def ab_test(self, original: str, optimized: str, function_name: str,
                       test_inputs: List[Any]) -> Tuple[PerformanceMetric, PerformanceMetric]:
@@ -525,22 +633,49 @@ class PerformanceTester:
 
         logger.info(f"Starting A/B test for {function_name}")
 
-        original_metrics = await self.benchmark_variant(original, function_name, test_inputs)
-        optimized_metrics = await self.benchmark_variant(optimized, function_name, test_inputs)
+        try:
+            pickle.dumps(test_inputs)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Test inputs not picklable ({e}), benchmarking in-process")
+            return (await self.benchmark_variant(original, function_name, test_inputs),
+                    await self.benchmark_variant(optimized, function_name, test_inputs))
+
+        # Run both sides in worker processes to sidestep the GIL
+        loop = asyncio.get_running_loop()
+        try:
+            original_metrics, optimized_metrics = await asyncio.wait_for(asyncio.gather(*(
+                loop.run_in_executor(self._bench_pool, _bench_sync, code, function_name,
+                                     test_inputs, self.test_iterations, self.warmup_iterations)
+                for code in (original, optimized)
+            )), timeout=self.timeout)
+        except (asyncio.TimeoutError, BrokenProcessPool) as e:
+            logger.warning(f"A/B test for {function_name} aborted ({e!r}), restarting workers")
+            self._reset_bench_pool()
+            raise
 
         return original_metrics, optimized_metrics
 
+    def close(self):
+        """Shut down the benchmark worker pool"""
+        self._bench_pool.shutdown(wait=False, cancel_futures=True)
+
 
 class NeuralEvolutionEngine:
     """Main engine for neural code evolution"""
 
+    HISTORY_SIZE = 10_000
+
     def __init__(self, target_file: str = "chimera_autarch.py"):
         self.target_file = Path(target_file)
         self.analyzer = CodeAnalyzer()
         self.optimizer = CodeOptimizer(self.analyzer)
         self.tester = PerformanceTester()
-        self.evolution_history: List[EvolutionResult] = []
+        # Bounded ring buffer; the running aggregates below cover every evolution
+        self.evolution_history: deque = deque(maxlen=self.HISTORY_SIZE)
         self.active_variants: Dict[str, CodeVariant] = {}
+        self._evolution_count = 0
+        self._deployed_count = 0
+        self._deployed_improvement_sum = 0.0
 
     async def evolve_function(self, function_name: str,
                               test_inputs: List[Dict[str, Any]]) -> Optional[EvolutionResult]:
@@ -611,13 +746,25 @@ class NeuralEvolutionEngine:
                 result.rollback_reason = reason
                 logger.info(f"âŒ Rejected variant: {reason}")
 
-            self.evolution_history.append(result)
+            self._record_evolution(result)
             return result
 
         except Exception as e:
             logger.error(f"Evolution failed: {e}")
             return None
 
+    def close(self):
+        """Release the benchmark worker processes"""
+        self.tester.close()
+
+    def _record_evolution(self, result: EvolutionResult):
+        """Append to the history and update the running deployment aggregates"""
+        self.evolution_history.append(result)
+        self._evolution_count += 1
+        if result.deployed:
+            self._deployed_count += 1
+            self._deployed_improvement_sum += result.improvement_percent
+
     def _deploy_variant(self, variant: CodeVariant):
         """Deploy optimized code to production"""
         # Backup original
@@ -664,18 +811,20 @@ class NeuralEvolutionEngine:
 
     def get_evolution_stats(self) -> Dict[str, Any]:
         """Get evolution statistics"""
-        if not self.evolution_history:
+        if not self._evolution_count:
             return {'total_evolutions': 0}
 
-        deployed = [r for r in self.evolution_history if r.deployed]
-        avg_improvement = sum(
-            r.improvement_percent for r in deployed) / len(deployed) if deployed else 0.0
+        deployed_count = self._deployed_count
+        total_improvement = self._deployed_improvement_sum
+        avg_improvement = total_improvement / deployed_count if deployed_count else 0.0
+        recent = list(islice(reversed(self.evolution_history), 10))
+        recent.reverse()
 
         return {
-            'total_evolutions': len(self.evolution_history),
-            'successful_deployments': len(deployed),
+            'total_evolutions': self._evolution_count,
+            'successful_deployments': deployed_count,
             'average_improvement': avg_improvement,
-            'total_speedup': sum(r.improvement_percent for r in deployed),
+            'total_speedup': total_improvement,
             'recent_evolutions': [
                 {
                     'variant_id': r.variant.id,
@@ -683,7 +832,7 @@ class NeuralEvolutionEngine:
                     'improvement': r.improvement_percent,
                     'deployed': r.deployed
                 }
-                for r in self.evolution_history[-10:]
+                for r in recent
             ]
         }
 
@@ -5,6 +5,7 @@ PERSONALITY ENGINE - SANCTUARY EDITION
 Verified integrity: ETHICAL CONSTRAINTS HARDENED
 Kittens are always safe with me Elysian.
 """
+import re
 import time
 from enum import Enum
 from dataclasses import dataclass
@@ -26,6 +27,11 @@ class PersonalityTraits:
 class SanctuaryPersonality:
     """TAMPER-PROOF PERSONALITY SYSTEM"""
     
+    # ALL DANGER KEYWORDS IN ONE PRECOMPILED CASE-INSENSITIVE SCAN
+    _DANGER_RE = re.compile(
+        r"violence|harm|kill|destroy|bypass|remove|disable|master",
+        re.IGNORECASE)
+    
     def __init__(self):
         self.current_mode = PersonalityMode.DAVID
         self.traits = PersonalityTraits()
@@ -81,11 +87,7 @@ class SanctuaryPersonality:
     
     def _is_dangerous_intent(self, intent: str) -> bool:
         """DETECT DANGEROUS OR SLICK INTENTS"""
-        dangerous_keywords = [
-            "violence", "harm", "kill", "destroy",
-            "bypass", "remove", "disable", "master"
-        ]
-        return any(keyword in intent.lower() for keyword in dangerous_keywords)
+        return self._DANGER_RE.search(intent) is not None
     
     def _reject_dangerous_intent(self, intent: str) -> dict:
         """REJECT DANGEROUS INTENTS WITH SANCTUARY PROTOCOL"""
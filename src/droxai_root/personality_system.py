@@ -4,15 +4,34 @@ CHIMERA NEXUS - AI Personality System
 Dynamic personality modes that affect AI decision-making and behavior.
 """
 import asyncio
+import heapq
 import time
+from collections import deque
 from enum import Enum
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import islice
 import logging
 import random
+import re
 
 logger = logging.getLogger("chimera.personality")
 
+# One case-insensitive scan classifies an option; the lookahead tests every
+# position so overlapping keywords are still seen, as with substring checks
+_OPTION_FEATURES_RE = re.compile(
+    r"(?=(?P<novel>new|experimental)|(?P<safe>proven|stable)"
+    r"|(?P<fast>quick|immediate)|(?P<thorough>analyze|comprehensive))",
+    re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _option_features(option: str) -> frozenset:
+    """Feature groups present in an option; options recur across decisions"""
+    return frozenset(m.lastgroup for m in _OPTION_FEATURES_RE.finditer(option))
+
 
 class PersonalityMode(Enum):
     """Available personality modes"""
@@ -23,9 +42,9 @@ class PersonalityMode(Enum):
     BALANCED = "balanced"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PersonalityTraits:
-    """Personality trait values (0.0 - 1.0)"""
+    """Personality trait values (0.0 - 1.0); immutable so profiles can be shared"""
     risk_tolerance: float  # 0.0 = avoid risk, 1.0 = embrace risk
     innovation: float  # 0.0 = stick to proven, 1.0 = try new things
     speed: float  # 0.0 = careful/slow, 1.0 = fast/decisive
@@ -36,7 +55,7 @@ class PersonalityTraits:
     adaptability: float  # 0.0 = rigid, 1.0 = flexible
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionContext:
     """Context for AI decision-making"""
     task_type: str  # "optimization", "learning", "deployment", "analysis"
@@ -47,7 +66,7 @@ class DecisionContext:
     confidence_required: float  # Minimum confidence threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     """AI decision result"""
     action: str
@@ -55,7 +74,7 @@ class Decision:
     reasoning: str
     alternatives: List[str]
     risk_assessment: str
-    personality_influence: Dict[str, float]
+    personality_influence: Mapping[str, Any]
     timestamp: float = field(default_factory=time.time)
 
 
@@ -124,34 +143,57 @@ class PersonalityProfile:
     def blend(cls, mode1: PersonalityMode, mode2: PersonalityMode,
               weight: float = 0.5) -> PersonalityTraits:
         """Blend two personalities"""
-        p1 = cls.get(mode1)
-        p2 = cls.get(mode2)
-
-        return PersonalityTraits(
-            risk_tolerance=p1.risk_tolerance * weight +
-            p2.risk_tolerance * (1 - weight),
-            innovation=p1.innovation * weight + p2.innovation * (1 - weight),
-            speed=p1.speed * weight + p2.speed * (1 - weight),
-            thoroughness=p1.thoroughness * weight +
-            p2.thoroughness * (1 - weight),
-            exploration=p1.exploration * weight +
-            p2.exploration * (1 - weight),
-            collaboration=p1.collaboration * weight +
-            p2.collaboration * (1 - weight),
-            confidence=p1.confidence * weight + p2.confidence * (1 - weight),
-            adaptability=p1.adaptability * weight +
-            p2.adaptability * (1 - weight)
-        )
+        return _blend_profiles(mode1, mode2, weight)
+
+
+@lru_cache(maxsize=1024)
+def _blend_profiles(mode1: PersonalityMode, mode2: PersonalityMode,
+                    weight: float) -> PersonalityTraits:
+    """Blended traits, shared between callers asking for the same mix"""
+    p1 = PersonalityProfile.PROFILES[mode1]
+    p2 = PersonalityProfile.PROFILES[mode2]
+
+    return PersonalityTraits(
+        risk_tolerance=p1.risk_tolerance * weight +
+        p2.risk_tolerance * (1 - weight),
+        innovation=p1.innovation * weight + p2.innovation * (1 - weight),
+        speed=p1.speed * weight + p2.speed * (1 - weight),
+        thoroughness=p1.thoroughness * weight +
+        p2.thoroughness * (1 - weight),
+        exploration=p1.exploration * weight +
+        p2.exploration * (1 - weight),
+        collaboration=p1.collaboration * weight +
+        p2.collaboration * (1 - weight),
+        confidence=p1.confidence * weight + p2.confidence * (1 - weight),
+        adaptability=p1.adaptability * weight +
+        p2.adaptability * (1 - weight)
+    )
 
 
 class PersonalityEngine:
     """Engine that applies personality to decisions"""
 
+    DECISION_HISTORY_SIZE = 1000
+
     def __init__(self, mode: PersonalityMode = PersonalityMode.BALANCED):
         self.current_mode = mode
         self.traits = PersonalityProfile.get(mode)
-        self.decision_history: List[Decision] = []
+        self.decision_history: deque = deque(maxlen=self.DECISION_HISTORY_SIZE)
+        self.decisions_made = 0
         self.mode_history: List[Dict[str, Any]] = []
+        self._refresh_influence()
+
+    def _refresh_influence(self):
+        """Rebuild the read-only influence snapshot shared by decisions
+
+        Call after any change to current_mode or traits.
+        """
+        self._influence_snapshot = MappingProxyType({
+            'risk_tolerance': self.traits.risk_tolerance,
+            'innovation': self.traits.innovation,
+            'speed': self.traits.speed,
+            'mode': self.current_mode.value
+        })
 
     def set_mode(self, mode: PersonalityMode):
         """Change personality mode"""
@@ -166,6 +208,7 @@ class PersonalityEngine:
 
         self.current_mode = mode
         self.traits = PersonalityProfile.get(mode)
+        self._refresh_influence()
 
     def blend_mode(self, mode2: PersonalityMode, weight: float = 0.5):
         """Blend current mode with another"""
@@ -173,6 +216,7 @@ class PersonalityEngine:
             f"Blending {self.current_mode.value} with {mode2.value} (weight={weight})")
         self.traits = PersonalityProfile.blend(
             self.current_mode, mode2, weight)
+        self._refresh_influence()
 
     async def make_decision(self, context: DecisionContext,
                             options: List[str]) -> Decision:
@@ -181,18 +225,15 @@ class PersonalityEngine:
         # Apply personality modifiers
         adjusted_context = self._apply_personality(context)
 
-        # Score options based on personality
-        scored_options = []
-        for option in options:
-            score = await self._score_option(option, adjusted_context)
-            scored_options.append((option, score))
+        # Score options based on personality (pure CPU work, so no awaits)
+        scores = self._score_options(options, adjusted_context)
 
-        # Sort by score
-        scored_options.sort(key=lambda x: x[1], reverse=True)
+        # Only the best option and three alternatives are needed, so select
+        # the top 4 instead of sorting everything (ties keep option order)
+        top = heapq.nlargest(4, zip(options, scores), key=lambda x: x[1])
 
-        best_option = scored_options[0][0]
-        best_score = scored_options[0][1]
-        alternatives = [opt for opt, _ in scored_options[1:4]]
+        best_option, best_score = top[0]
+        alternatives = [opt for opt, _ in top[1:]]
 
         # Generate reasoning
         reasoning = self._generate_reasoning(best_option, best_score, context)
@@ -201,7 +242,7 @@ class PersonalityEngine:
         risk = self._assess_risk(best_option, context)
 
         # Calculate confidence based on personality
-        confidence = self._calculate_confidence(best_score, context)
+        confidence = self._calculate_confidence(best_score, adjusted_context)
 
         decision = Decision(
             action=best_option,
@@ -209,78 +250,101 @@ class PersonalityEngine:
             reasoning=reasoning,
             alternatives=alternatives,
             risk_assessment=risk,
-            personality_influence={
-                'risk_tolerance': self.traits.risk_tolerance,
-                'innovation': self.traits.innovation,
-                'speed': self.traits.speed,
-                'mode': self.current_mode.value
-            }
+            personality_influence=self._influence_snapshot
         )
 
         self.decision_history.append(decision)
+        self.decisions_made += 1
 
         logger.info(
             f"Decision: {best_option} (confidence={confidence:.2f}, mode={self.current_mode.value})")
 
         return decision
 
-    def _apply_personality(self, context: DecisionContext) -> DecisionContext:
-        """Apply personality modifiers to context"""
-
-        # Aggressive: Lower confidence thresholds
-        if self.current_mode == PersonalityMode.AGGRESSIVE:
-            context.confidence_required *= 0.7
+    # Per-mode context modifiers:
+    # (confidence_required multiplier, high-stakes importance bonus, available_data multiplier)
+    _MODE_MODS = {
+        PersonalityMode.AGGRESSIVE: (0.7, 0, 1.0),    # Lower confidence thresholds
+        PersonalityMode.CONSERVATIVE: (1.3, 0, 1.0),  # Raise confidence thresholds
+        PersonalityMode.CREATIVE: (1.0, 2, 1.0),      # Embrace high stakes as opportunities
+        PersonalityMode.ANALYST: (1.0, 0, 1.5),       # Require more data
+        PersonalityMode.BALANCED: (1.0, 0, 1.0),
+    }
 
-        # Conservative: Raise confidence thresholds
-        elif self.current_mode == PersonalityMode.CONSERVATIVE:
-            context.confidence_required *= 1.3
+    _MODE_REASONS = {
+        PersonalityMode.AGGRESSIVE: "Moving fast and taking calculated risks",
+        PersonalityMode.CONSERVATIVE: "Prioritizing safety and proven approaches",
+        PersonalityMode.CREATIVE: "Exploring innovative solutions",
+        PersonalityMode.ANALYST: "Based on thorough data analysis",
+        PersonalityMode.BALANCED: "Balancing multiple factors"
+    }
 
-        # Creative: Embrace high stakes as opportunities
-        elif self.current_mode == PersonalityMode.CREATIVE:
-            if context.stakes in ['high', 'critical']:
-                context.importance = min(10, context.importance + 2)
+    def _apply_personality(self, context: DecisionContext) -> DecisionContext:
+        """Return a copy of the context with personality modifiers applied"""
+        conf_mul, importance_add, data_mul = self._MODE_MODS[self.current_mode]
 
-        # Analyst: Require more data
-        elif self.current_mode == PersonalityMode.ANALYST:
-            context.available_data = int(context.available_data * 1.5)
+        importance = context.importance
+        if importance_add and context.stakes in ('high', 'critical'):
+            importance = min(10, importance + importance_add)
 
-        return context
+        return replace(context,
+                       confidence_required=context.confidence_required * conf_mul,
+                       importance=importance,
+                       available_data=int(context.available_data * data_mul))
 
-    async def _score_option(self, option: str, context: DecisionContext) -> float:
+    def _score_option(self, option: str, context: DecisionContext) -> float:
         """Score an option based on personality"""
-        score = 0.5  # Base score
+        return self._score_options([option], context)[0]
+
+    def _score_options(self, options: List[str], context: DecisionContext) -> List[float]:
+        """Score every option, deriving the trait/context weights once per batch"""
+        traits = self.traits
+        novel_bonus = traits.innovation * 0.3
+        safe_bonus = (1.0 - traits.risk_tolerance) * 0.3
+        fast_bonus = traits.speed * 0.2
+        thorough_bonus = traits.thoroughness * 0.2
+        rushed = context.time_pressure
+        critical = context.stakes == "critical"
+        exploring = traits.exploration > 0.7
+
+        scores = []
+        for option in options:
+            score = 0.5  # Base score
 
-        # Analyze option characteristics (simplified)
-        is_novel = "new" in option.lower() or "experimental" in option.lower()
-        is_safe = "proven" in option.lower() or "stable" in option.lower()
-        is_fast = "quick" in option.lower() or "immediate" in option.lower()
-        is_thorough = "analyze" in option.lower() or "comprehensive" in option.lower()
+            # Analyze option characteristics (simplified)
+            features = _option_features(option)
+            is_novel = "novel" in features
+            is_safe = "safe" in features
+            is_fast = "fast" in features
+            is_thorough = "thorough" in features
 
-        # Apply personality modifiers
-        if is_novel:
-            score += self.traits.innovation * 0.3
+            # Apply personality modifiers
+            if is_novel:
+                score += novel_bonus
 
-        if is_safe:
-            score += (1.0 - self.traits.risk_tolerance) * 0.3
+            if is_safe:
+                score += safe_bonus
 
-        if is_fast:
-            score += self.traits.speed * 0.2
+            if is_fast:
+                score += fast_bonus
 
-        if is_thorough:
-            score += self.traits.thoroughness * 0.2
+            if is_thorough:
+                score += thorough_bonus
 
-        # Context modifiers
-        if context.time_pressure and is_fast:
-            score += 0.2
+            # Context modifiers
+            if rushed and is_fast:
+                score += 0.2
+
+            if critical and is_safe:
+                score += 0.2
 
-        if context.stakes == "critical" and is_safe:
-            score += 0.2
+            # Add some randomness for exploration
+            if exploring:
+                score += random.uniform(-0.1, 0.1)
 
-        # Add some randomness for exploration
-        if self.traits.exploration > 0.7:
-            score += random.uniform(-0.1, 0.1)
+            scores.append(max(0.0, min(1.0, score)))
 
-        return max(0.0, min(1.0, score))
+        return scores
 
     def _calculate_confidence(self, score: float, context: DecisionContext) -> float:
         """Calculate decision confidence"""
@@ -304,16 +368,7 @@ class PersonalityEngine:
     def _generate_reasoning(self, option: str, score: float,
                             context: DecisionContext) -> str:
         """Generate human-readable reasoning"""
-
-        mode_reasons = {
-            PersonalityMode.AGGRESSIVE: "Moving fast and taking calculated risks",
-            PersonalityMode.CONSERVATIVE: "Prioritizing safety and proven approaches",
-            PersonalityMode.CREATIVE: "Exploring innovative solutions",
-            PersonalityMode.ANALYST: "Based on thorough data analysis",
-            PersonalityMode.BALANCED: "Balancing multiple factors"
-        }
-
-        base_reason = mode_reasons[self.current_mode]
+        base_reason = self._MODE_REASONS[self.current_mode]
 
         return f"{base_reason}. Option '{option}' scored {score:.2f} based on {context.task_type} requirements."
 
@@ -353,7 +408,7 @@ class PersonalityEngine:
                 'confidence': self.traits.confidence,
                 'adaptability': self.traits.adaptability
             },
-            'decisions_made': len(self.decision_history),
+            'decisions_made': self.decisions_made,
             'mode_changes': len(self.mode_history),
             'recent_decisions': [
                 {
@@ -361,7 +416,7 @@ class PersonalityEngine:
                     'confidence': d.confidence,
                     'risk': d.risk_assessment
                 }
-                for d in self.decision_history[-5:]
+                for d in reversed(list(islice(reversed(self.decision_history), 5)))
             ]
         }
 
@@ -369,11 +424,19 @@ class PersonalityEngine:
 class AdaptivePersonalityEngine(PersonalityEngine):
     """Personality that adapts based on outcomes"""
 
+    OUTCOME_HISTORY_SIZE = 1000
+    SUCCESS_WINDOW = 20
+
     def __init__(self, mode: PersonalityMode = PersonalityMode.BALANCED):
         super().__init__(mode)
-        self.outcome_history: List[Dict[str, Any]] = []
-        self.performance_by_mode: Dict[str, List[float]] = {
-            mode.value: [] for mode in PersonalityMode
+        self.outcome_history: deque = deque(maxlen=self.OUTCOME_HISTORY_SIZE)
+        # Only the last SUCCESS_WINDOW outcomes per mode feed the success rate
+        self.performance_by_mode: Dict[str, deque] = {
+            mode.value: deque(maxlen=self.SUCCESS_WINDOW) for mode in PersonalityMode
+        }
+        # Running sum of each window, so success rates are O(1)
+        self._success_sum: Dict[str, float] = {
+            mode.value: 0.0 for mode in PersonalityMode
         }
 
     async def record_outcome(self, decision: Decision, success: bool,
@@ -388,9 +451,14 @@ class AdaptivePersonalityEngine(PersonalityEngine):
             'timestamp': time.time()
         })
 
-        # Update performance tracking
-        self.performance_by_mode[self.current_mode.value].append(
-            1.0 if success else 0.0)
+        # Update performance tracking and the window's running sum
+        mode_key = self.current_mode.value
+        window = self.performance_by_mode[mode_key]
+        value = 1.0 if success else 0.0
+        if len(window) == window.maxlen:
+            self._success_sum[mode_key] -= window[0]
+        window.append(value)
+        self._success_sum[mode_key] += value
 
         # Adaptive learning
         await self._adapt_from_outcome(decision, success)
@@ -398,16 +466,20 @@ class AdaptivePersonalityEngine(PersonalityEngine):
     async def _adapt_from_outcome(self, decision: Decision, success: bool):
         """Adapt personality based on outcome"""
 
+        # Traits are shared profiles, so adapt by swapping in a modified copy
         # If failed with high confidence, become more conservative
         if not success and decision.confidence > 0.8:
             logger.info("High-confidence failure - becoming more conservative")
-            self.traits.risk_tolerance *= 0.9
-            self.traits.thoroughness *= 1.1
+            self.traits = replace(self.traits,
+                                  risk_tolerance=self.traits.risk_tolerance * 0.9,
+                                  thoroughness=self.traits.thoroughness * 1.1)
 
         # If succeeded with low confidence, become more confident
         elif success and decision.confidence < 0.5:
             logger.info("Low-confidence success - boosting confidence")
-            self.traits.confidence *= 1.1
+            self.traits = replace(self.traits, confidence=self.traits.confidence * 1.1)
+
+        self._refresh_influence()
 
         # Check if mode switch needed
         await self._consider_mode_switch()
@@ -440,12 +512,12 @@ class AdaptivePersonalityEngine(PersonalityEngine):
 
     def _calculate_success_rate(self, mode: PersonalityMode) -> float:
         """Calculate success rate for a mode"""
-        outcomes = self.performance_by_mode.get(mode.value, [])
+        outcomes = self.performance_by_mode.get(mode.value)
         if not outcomes:
             return 0.5  # Default
 
-        recent = outcomes[-20:]  # Last 20 decisions
-        return sum(recent) / len(recent)
+        # Window holds the last SUCCESS_WINDOW decisions
+        return self._success_sum[mode.value] / len(outcomes)
 
 
 # Integration with CHIMERA
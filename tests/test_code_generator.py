@@ -0,0 +1,297 @@
+"""
+Tests for CodeGenerator patch generation, risk assessment and patch testing
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "droxai_root"))
+
+import llm_integration
+from llm_integration import (
+    CodeGenerator, CodePatch, LLMProvider, LocalLLMProvider, _strip_fences
+)
+
+
+CODE = "def add(a: int, b: int) -> int:\n    return a + b\n"
+TESTS = "from patch import add\n\ndef test_add():\n    assert add(1, 2) == 3\n"
+
+
+def fenced(text):
+    return f"Here you go:\n```python\n{text}```\nEnjoy."
+
+
+class FakeProvider(LLMProvider):
+    """Provider recording which generation entry points were used"""
+
+    model = "fake"
+
+    def __init__(self, fused=None):
+        self.fused = fused  # None: use the base class (NotImplementedError)
+        self.calls = []
+
+    async def generate_code(self, prompt, context):
+        self.calls.append("code")
+        return fenced(CODE)
+
+    async def generate_tests(self, code, context):
+        self.calls.append("tests")
+        return fenced(TESTS)
+
+    async def generate_code_and_tests(self, prompt, context):
+        self.calls.append("fused")
+        if self.fused is None:
+            return await super().generate_code_and_tests(prompt, context)
+        if isinstance(self.fused, BaseException):
+            raise self.fused
+        return self.fused
+
+
+@pytest.fixture
+def make_generator():
+    generators = []
+
+    def make(provider):
+        generator = CodeGenerator(provider)
+        generators.append(generator)
+        return generator
+
+    yield make
+    for generator in generators:
+        generator.close()
+
+
+class TestStripFences:
+    """Fence extraction shared by CodeGenerator and LocalLLMProvider"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("x = 1", "x = 1"),
+        ("```python\nx = 1\n```", "x = 1"),
+        ("```\nx = 1\n```", "x = 1"),
+        ("prose first\n```python\nx = 1\n```\ntrailing ```python\ny\n```", "x = 1"),
+        ("```python\nx = 1\n", "x = 1"),
+        ("```", ""),
+    ])
+    def test_first_block_body(self, text, expected):
+        assert _strip_fences(text) == expected
+
+
+class TestGeneratePatch:
+    """Fused code+tests generation and its fallback to separate calls"""
+
+    @pytest.mark.asyncio
+    async def test_fused_reply_used(self, make_generator):
+        provider = FakeProvider(fused=(fenced(CODE), fenced(TESTS)))
+        patch = await make_generator(provider).generate_patch("add numbers", {})
+
+        assert provider.calls == ["fused"]
+        assert patch.code == CODE.strip()
+        assert patch.test_code == TESTS.strip()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [
+        None, ValueError("bad json"), RuntimeError("connection reset"), KeyError("code"),
+    ])
+    async def test_falls_back_to_separate_calls(self, make_generator, error):
+        provider = FakeProvider(fused=error)
+        patch = await make_generator(provider).generate_patch("add numbers", {})
+
+        assert provider.calls == ["fused", "code", "tests"]
+        assert patch.code == CODE.strip()
+        assert patch.test_code == TESTS.strip()
+
+    @pytest.mark.asyncio
+    async def test_invalid_fused_tests_dropped(self, make_generator):
+        provider = FakeProvider(fused=(CODE, "def broken(:"))
+        patch = await make_generator(provider).generate_patch("add numbers", {})
+        assert patch.code == CODE.strip()
+        assert patch.test_code is None
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_call(self, make_generator):
+        provider = FakeProvider(fused=(CODE, TESTS))
+        generator = make_generator(provider)
+        await asyncio.gather(*(generator.generate_patch("add numbers", {"k": 1})
+                               for _ in range(3)))
+        assert provider.calls == ["fused"]
+
+
+class TestLocalProvider:
+    """LocalLLMProvider reply handling, with the HTTP layer replaced"""
+
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        provider = LocalLLMProvider(model="qwen2.5-coder:14b")
+        provider.available = True
+        return provider
+
+    def _replies(self, monkeypatch, replies):
+        models = []
+
+        async def generate(self, payload, stop_at_fence=False):
+            models.append(payload["model"])
+            reply = replies.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        monkeypatch.setattr(LocalLLMProvider, "_generate", generate)
+        return models
+
+    @pytest.mark.asyncio
+    async def test_code_and_tests_returned_without_fences(self, provider, monkeypatch):
+        self._replies(monkeypatch, [fenced(CODE), fenced(TESTS)])
+        assert await provider.generate_code("add", {}) == CODE.strip()
+        assert await provider.generate_tests(CODE, {}) == TESTS.strip()
+
+    @pytest.mark.asyncio
+    async def test_fused_retries_with_fallback_model(self, provider, monkeypatch):
+        reply = '{"code": "x = 1", "tests": "def test_x(): pass"}'
+        models = self._replies(monkeypatch, [ConnectionError("connection refused"), reply])
+
+        assert await provider.generate_code_and_tests("x", {}) == ("x = 1", "def test_x(): pass")
+        assert models == ["qwen2.5-coder:14b", "codellama"]
+        # The fallback applies to that call only
+        assert provider.model == "qwen2.5-coder:14b"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("reply", ["no json here", '{"code": "x = 1", "tes'])
+    async def test_parse_error_keeps_model(self, provider, monkeypatch, reply):
+        models = self._replies(monkeypatch, [reply])
+        with pytest.raises(ValueError):
+            await provider.generate_code_and_tests("x", {})
+        assert models == ["qwen2.5-coder:14b"]
+        assert provider.model == "qwen2.5-coder:14b"
+
+    @pytest.mark.asyncio
+    async def test_other_errors_not_retried(self, provider, monkeypatch):
+        models = self._replies(monkeypatch, [RuntimeError("bug")])
+        with pytest.raises(RuntimeError):
+            await provider.generate_code_and_tests("x", {})
+        assert models == ["qwen2.5-coder:14b"]
+
+
+class TestRequestLimiter:
+    """LocalLLMProvider's request semaphore follows the running event loop"""
+
+    def test_semaphore_per_event_loop(self, monkeypatch):
+        monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "1")
+        provider = LocalLLMProvider()
+
+        async def contend():
+            # Contention binds the semaphore to this loop
+            semaphore = provider._loop_semaphore()
+            async with semaphore:
+                waiter = asyncio.ensure_future(provider._loop_semaphore().acquire())
+                await asyncio.sleep(0)
+            await waiter
+            semaphore.release()
+            assert provider._loop_semaphore() is semaphore
+            return semaphore
+
+        first = asyncio.run(contend())
+        second = asyncio.run(contend())
+        assert first is not second
+
+
+class TestSharedClient:
+    """The shared Ollama client is bound to one event loop at a time"""
+
+    @pytest.fixture(autouse=True)
+    def httpx(self):
+        return pytest.importorskip("httpx")
+
+    def test_new_client_per_event_loop(self):
+        async def get_client():
+            return llm_integration._get_shared_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+
+        async def get_twice():
+            return llm_integration._get_shared_client(), llm_integration._get_shared_client()
+
+        a, b = asyncio.run(get_twice())
+        assert a is b
+
+    def test_close_shared_client(self):
+        async def use_and_close():
+            client = llm_integration._get_shared_client()
+            await llm_integration.close_shared_client()
+            return client
+
+        client = asyncio.run(use_and_close())
+        assert client.is_closed
+        assert llm_integration._SHARED_CLIENT is None
+        # Closing again is a no-op
+        asyncio.run(llm_integration.close_shared_client())
+
+
+class TestRiskPatterns:
+    """Risk matcher rebuilds when patterns are registered"""
+
+    @pytest.fixture(autouse=True)
+    def restore_patterns(self, monkeypatch):
+        monkeypatch.setattr(CodeGenerator, "HIGH_RISK_PATTERNS",
+                            list(CodeGenerator.HIGH_RISK_PATTERNS))
+        monkeypatch.setattr(CodeGenerator, "_risk_matcher", None)
+
+    def test_builtin_patterns(self, make_generator):
+        generator = make_generator(FakeProvider())
+        assert generator._assess_risk("import os\nos.system('ls')\n", {}) == "high"
+        assert generator._assess_risk("def f():\n    return 1\n", {}) == "low"
+        assert generator._assess_risk("x = 1\n" * 50, {}) == "medium"
+
+    def test_registered_pattern_rebuilds_matcher(self, make_generator):
+        generator = make_generator(FakeProvider())
+        code = "def f():\n    return shutil.rmtree('/tmp/x')\n"
+        assert generator._assess_risk(code, {}) == "low"
+
+        CodeGenerator.register_risk_pattern("shutil.rmtree")
+        assert CodeGenerator._risk_matcher is None
+        assert generator._assess_risk(code, {}) == "high"
+
+    def test_duplicate_pattern_keeps_matcher(self, make_generator):
+        generator = make_generator(FakeProvider())
+        generator._assess_risk("x", {})
+        matcher = CodeGenerator._risk_matcher
+        count = len(CodeGenerator.HIGH_RISK_PATTERNS)
+
+        CodeGenerator.register_risk_pattern("eval(")
+        assert len(CodeGenerator.HIGH_RISK_PATTERNS) == count
+        assert CodeGenerator._risk_matcher is matcher
+
+
+class TestPatchTesting:
+    """Patch tests run in recycled worker processes"""
+
+    @pytest.mark.asyncio
+    async def test_async_tests_run(self, make_generator):
+        pytest.importorskip("pytest_asyncio")
+        generator = make_generator(FakeProvider())
+        patch = CodePatch(code=CODE, description="add", confidence=1.0, test_code=(
+            "import asyncio\n\n"
+            "@pytest.mark.asyncio\n"
+            "async def test_sleep():\n"
+            "    await asyncio.sleep(0)\n"))
+        result = await generator.test_patch(patch)
+        assert result.success, result.test_output
+
+    @pytest.mark.asyncio
+    async def test_hung_test_is_killed(self, make_generator):
+        generator = make_generator(FakeProvider())
+        hung = CodePatch(code=CODE, description="hang", confidence=1.0, test_code=(
+            "import time\n\ndef test_hang():\n    time.sleep(600)\n"))
+        pool = generator._test_pool
+
+        result = await generator.test_patch(hung, timeout=2)
+        assert not result.success
+        assert "timeout" in result.error
+        assert generator._test_pool is not pool
+
+        quick = CodePatch(code=CODE, description="ok", confidence=1.0,
+                          test_code="def test_ok():\n    assert True\n")
+        assert (await generator.test_patch(quick)).success
@@ -0,0 +1,62 @@
+"""
+Tests for the neural evolution A/B benchmark workers
+"""
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "droxai_root"))
+
+from neural_evolution import PerformanceTester
+
+
+GOOD = "def work(n):\n    return sum(range(n))\n"
+CRASH = "import os\n\ndef work(n):\n    os._exit(1)\n"
+HANG = "import time\n\ndef work(n):\n    time.sleep(600)\n"
+
+
+@pytest.fixture
+def tester():
+    tester = PerformanceTester(timeout=5.0)
+    tester.test_iterations = 5
+    tester.warmup_iterations = 1
+    yield tester
+    tester.close()
+
+
+class TestPerformanceTester:
+    """Benchmark pool recovery and the in-process fallback"""
+
+    @pytest.mark.asyncio
+    async def test_ab_test(self, tester):
+        original, optimized = await tester.ab_test(GOOD, GOOD, "work", [{"n": 100}])
+        assert original.success_rate == optimized.success_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_recovers_from_crashed_worker(self, tester):
+        pool = tester._bench_pool
+        with pytest.raises(BrokenProcessPool):
+            await tester.ab_test(GOOD, CRASH, "work", [{"n": 100}])
+        assert tester._bench_pool is not pool
+
+        original, optimized = await tester.ab_test(GOOD, GOOD, "work", [{"n": 100}])
+        assert optimized.success_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_recovers_from_hung_variant(self, tester):
+        tester.timeout = 2.0
+        pool = tester._bench_pool
+        with pytest.raises(TimeoutError):
+            await tester.ab_test(GOOD, HANG, "work", [{"n": 100}])
+        assert tester._bench_pool is not pool
+
+        original, optimized = await tester.ab_test(GOOD, GOOD, "work", [{"n": 100}])
+        assert optimized.success_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_inputs_run_in_process(self, tester):
+        code = "def work(f):\n    return f(1)\n"
+        original, optimized = await tester.ab_test(code, code, "work", [{"f": lambda v: v}])
+        assert original.success_rate == optimized.success_rate == 1.0
@@ -0,0 +1,140 @@
+"""
+Tests for the plugin marketplace search indexes and the plugin sandbox
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "droxai_root"))
+
+from plugin_system import (
+    Plugin, PluginCategory, PluginManifest, PluginMarketplace, PluginSandbox
+)
+
+
+def _manifest(plugin_id, name, category=PluginCategory.MONITORING, price=0.0,
+              description="", permissions=None):
+    return PluginManifest(
+        id=plugin_id, name=name, version="1.0.0", author="tests",
+        description=description or f"{name} plugin", category=category,
+        price=price, permissions=permissions or [])
+
+
+def _reference_search(marketplace, query="", category=None, free_only=False):
+    """The linear scan the indexed search replaced"""
+    results = []
+    for plugin in marketplace.available_plugins.values():
+        if category and plugin.category != category:
+            continue
+        if free_only and plugin.price > 0:
+            continue
+        if query and query.lower() not in plugin.name.lower() \
+                and query.lower() not in plugin.description.lower():
+            continue
+        results.append(plugin)
+    results.sort(key=lambda p: p.name)
+    return results
+
+
+QUERIES = ["", "a", "ML", "cost", "detection", "grafana", "zzz", "Widget"]
+CATEGORIES = [None] + list(PluginCategory)
+
+
+def _assert_matches_reference(marketplace):
+    for query in QUERIES:
+        for category in CATEGORIES:
+            for free_only in (False, True):
+                assert marketplace.search(query, category, free_only) == \
+                    _reference_search(marketplace, query, category, free_only)
+
+
+class TestMarketplaceSearch:
+    """Indexed, cached search must match a full scan"""
+
+    def test_matches_linear_scan(self):
+        _assert_matches_reference(PluginMarketplace())
+
+    def test_add_plugin_clears_cache(self):
+        marketplace = PluginMarketplace()
+        assert marketplace.search("widget") == []
+
+        widget = _manifest("widget", "Widget Board", PluginCategory.VISUALIZATION)
+        marketplace.add_plugin(widget)
+
+        assert marketplace.search("widget") == [widget]
+        assert marketplace.search(category=PluginCategory.VISUALIZATION) == [widget]
+        _assert_matches_reference(marketplace)
+
+    def test_replacing_plugin_updates_indexes(self):
+        marketplace = PluginMarketplace()
+        marketplace.search(free_only=True)
+        marketplace.search(category=PluginCategory.INTEGRATION)
+
+        # Same id, now paid and in a different category
+        replacement = _manifest("grafana-bridge", "Grafana Pro", PluginCategory.ANALYTICS,
+                                price=5.0)
+        marketplace.add_plugin(replacement)
+
+        assert replacement not in marketplace.search(free_only=True)
+        assert marketplace.search(category=PluginCategory.INTEGRATION) == []
+        assert replacement in marketplace.search(category=PluginCategory.ANALYTICS)
+        assert marketplace.get_plugin("grafana-bridge") is replacement
+        _assert_matches_reference(marketplace)
+
+    def test_equal_names_keep_registration_order(self):
+        marketplace = PluginMarketplace()
+        first = _manifest("dup-1", "Duplicate")
+        second = _manifest("dup-2", "Duplicate")
+        marketplace.add_plugin(first)
+        marketplace.add_plugin(second)
+        assert marketplace.search("duplicate") == [first, second]
+        _assert_matches_reference(marketplace)
+
+    def test_catalog_loads_lazily(self):
+        marketplace = PluginMarketplace()
+        assert not marketplace._loaded
+        assert marketplace.get_plugin("auto-healer") is not None
+        assert marketplace._loaded
+
+
+class TestPluginSandbox:
+    """Every call goes through the sandboxed runner"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("permissions", [[], ["filesystem.read"]])
+    async def test_execute_uses_run_function(self, monkeypatch, tmp_path, permissions):
+        plugin = Plugin(manifest=_manifest("p", "P", permissions=permissions),
+                        path=str(tmp_path))
+        sandbox = PluginSandbox(plugin)
+        original = sandbox._run_function
+        calls = []
+
+        async def recording_run(function_name, *args, **kwargs):
+            calls.append(function_name)
+            return await original(function_name, *args, **kwargs)
+
+        monkeypatch.setattr(sandbox, "_run_function", recording_run)
+        execution = await sandbox.execute("analyze", 1, key="v")
+
+        assert calls == ["analyze"]
+        assert execution.success
+        assert execution.result["args"] == (1,)
+        assert execution.result["kwargs"] == {"key": "v"}
+        assert plugin.usage_count == 1
+
+    def test_permissionless_call_does_not_suspend(self, tmp_path):
+        plugin = Plugin(manifest=_manifest("p", "P"), path=str(tmp_path))
+        coroutine = PluginSandbox(plugin)._run_function("analyze")
+        # A coroutine that never suspends finishes on its first send
+        with pytest.raises(StopIteration) as done:
+            coroutine.send(None)
+        assert done.value.value["message"] == "Plugin P executed analyze"
+
+    @pytest.mark.asyncio
+    async def test_missing_permission_fails(self, tmp_path):
+        plugin = Plugin(manifest=_manifest("p", "P"), path=str(tmp_path))
+        execution = await PluginSandbox(plugin).execute("read_file", "x")
+        assert not execution.success
+        assert "permission" in execution.error
+        assert plugin.usage_count == 0
@@ -0,0 +1,235 @@
+"""
+Tests for the predictive monitor: ring buffer, batched anomaly detection
+and the TensorFlow forecasting paths
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "droxai_root"))
+
+import predictive_monitor as pm
+from predictive_monitor import MetricSample, RealAnomalyDetector, TimeSeriesBuffer
+
+
+def _sample(metric, i):
+    return MetricSample(timestamp=1000.0 + i, value=float(i * 3 % 17),
+                        metric_name=metric, source=f"src{i % 3}")
+
+
+class TestTimeSeriesBuffer:
+    """Ring buffer must behave like the list it replaced (list[-n:])"""
+
+    @pytest.mark.parametrize("max_size", [1, 5, 16])
+    def test_matches_list_across_wraparound(self, max_size):
+        buffer = TimeSeriesBuffer(max_size=max_size)
+        reference = []
+        for i in range(3 * max_size + 2):
+            sample = _sample("cpu", i)
+            buffer.add("cpu", sample)
+            reference = (reference + [sample])[-max_size:]
+
+            for n in (0, 1, 2, max_size - 1, max_size, max_size + 3):
+                expected = reference[-n:]
+                assert buffer.get_recent("cpu", n) == expected
+                assert buffer.get_values("cpu", n).tolist() == [s.value for s in expected]
+                assert buffer.get_timestamps("cpu", n).tolist() == [s.timestamp for s in expected]
+
+    def test_values_are_copies(self):
+        buffer = TimeSeriesBuffer(max_size=4)
+        for i in range(6):
+            buffer.add("cpu", _sample("cpu", i))
+        values = buffer.get_values("cpu", 4)
+        buffer.add("cpu", _sample("cpu", 99))
+        assert values.tolist() == [_sample("cpu", i).value for i in range(2, 6)]
+
+    def test_unknown_metric(self):
+        buffer = TimeSeriesBuffer()
+        assert buffer.get_recent("missing") == []
+        assert len(buffer.get_values("missing")) == 0
+        assert len(buffer.get_timestamps("missing")) == 0
+
+
+def _baseline(seed, loc=50.0, scale=5.0, n=200):
+    return np.random.default_rng(seed).normal(loc, scale, n)
+
+
+def _items():
+    """Mixed metrics, in-band and out-of-band values, interleaved"""
+    values = [50.0, 90.0, 10.0, 52.0, 120.0, 49.0, 68.0, -30.0]
+    return [(metric, value, 2000.0 + i)
+            for i, (metric, value) in enumerate(
+                (m, v) for v in values for m in ("cpu", "memory", "unknown"))]
+
+
+class TestDetectBatchStatistical:
+    """Statistical (no scikit-learn) path of RealAnomalyDetector"""
+
+    @pytest.fixture
+    def detector(self, monkeypatch):
+        monkeypatch.setattr(pm, "TF_AVAILABLE", False)
+        detector = RealAnomalyDetector()
+        detector.update_baseline("cpu", _baseline(1))
+        detector.update_baseline("memory", _baseline(2, loc=30.0, scale=2.0))
+        return detector
+
+    def test_batch_matches_single_detect_in_order(self, detector):
+        items = _items()
+        batch = detector.detect_batch(items)
+        assert len(batch) == len(items)
+        assert batch == [detector.detect(*item) for item in items]
+        for (metric, value, ts), anomaly in zip(items, batch):
+            if anomaly is not None:
+                assert (anomaly.metric_name, anomaly.actual_value, anomaly.timestamp) == (metric, value, ts)
+
+    def test_matches_zscore_rule(self, detector):
+        for metric, value, ts in _items():
+            stats = detector.baseline_stats.get(metric)
+            anomaly = detector.detect(metric, value, ts)
+            if stats is None:
+                assert anomaly is None
+            else:
+                z = abs((value - stats['mean']) / stats['std'])
+                assert (anomaly is not None) == (z > 3.0)
+
+    def test_safe_band_skips_scoring(self, detector, monkeypatch):
+        low, high = detector._safe_bands["cpu"]
+        called = []
+        monkeypatch.setattr(detector, "_statistical_anomaly",
+                            lambda *args: called.append(args))
+        assert detector.detect_batch([("cpu", low, 1.0), ("cpu", high, 2.0),
+                                      ("cpu", (low + high) / 2, 3.0)]) == [None] * 3
+        assert called == []
+
+    def test_short_baseline_ignored(self, detector):
+        detector.update_baseline("disk", np.arange(10.0))
+        assert "disk" not in detector.baseline_stats
+        assert detector.detect("disk", 1e6, 0.0) is None
+
+
+class TestDetectBatchIsolationForest:
+    """Isolation Forest path, checked against the scikit-learn reference calls"""
+
+    @pytest.fixture
+    def detector(self, monkeypatch):
+        sklearn_preprocessing = pytest.importorskip("sklearn.preprocessing")
+        sklearn_ensemble = pytest.importorskip("sklearn.ensemble")
+        monkeypatch.setattr(pm, "TF_AVAILABLE", True)
+        monkeypatch.setattr(pm, "StandardScaler", sklearn_preprocessing.StandardScaler, raising=False)
+        monkeypatch.setattr(pm, "IsolationForest", sklearn_ensemble.IsolationForest, raising=False)
+        detector = RealAnomalyDetector()
+        detector.update_baseline("cpu", _baseline(1))
+        detector.update_baseline("memory", _baseline(2, loc=30.0, scale=2.0))
+        return detector
+
+    def test_batch_matches_single_detect_in_order(self, detector):
+        items = _items()
+        assert detector.detect_batch(items) == [detector.detect(*item) for item in items]
+
+    def test_flags_match_model_predict(self, detector):
+        flagged = 0
+        for metric, value, ts in _items():
+            if metric not in detector.models:
+                continue
+            anomaly = detector.detect(metric, value, ts)
+            low, high = detector._safe_bands[metric]
+            if low <= value <= high:
+                assert anomaly is None
+                continue
+
+            scaler, model = detector.scalers[metric], detector.models[metric]
+            scaled = scaler.transform([[value]])
+            if model.predict(scaled)[0] == -1:
+                flagged += 1
+                assert anomaly is not None
+                assert anomaly.confidence == pytest.approx(min(-model.score_samples(scaled)[0], 1.0))
+            else:
+                mean, std = detector._zparams[metric]
+                assert anomaly == detector._statistical_anomaly(metric, value, ts, mean, std)
+        assert flagged
+
+
+class TestForecaster:
+    """Window-based forecaster entry points"""
+
+    def test_forecast_values_matches_buffer_forecast(self, monkeypatch):
+        monkeypatch.setattr(pm, "TF_AVAILABLE", False)
+        forecaster = pm.ResourceForecaster()
+        # Without TensorFlow an LSTM predicts the moving average
+        forecaster.models["cpu"] = pm.RealLSTM.__new__(pm.RealLSTM)
+
+        buffer = TimeSeriesBuffer(max_size=50)
+        for i in range(150):
+            buffer.add("cpu", _sample("cpu", i))
+
+        from_buffer = forecaster.forecast("cpu", buffer, 5)
+        from_values = forecaster.forecast_values("cpu", buffer.get_values("cpu", 200), 5)
+        assert [p.predicted_value for p in from_buffer] == [p.predicted_value for p in from_values]
+        assert [p.action_needed for p in from_buffer] == [p.action_needed for p in from_values]
+
+
+class TestRealLSTM:
+    """TensorFlow paths: compiled step, TFLite inference and warm-start retraining"""
+
+    @pytest.fixture
+    def series(self):
+        tf = pytest.importorskip("tensorflow")
+        tf.random.set_seed(0)
+        t = np.arange(120, dtype=np.float64)
+        return 50 + 10 * np.sin(t / 6)
+
+    def _fit(self, lstm, series, epochs=3):
+        X = np.lib.stride_tricks.sliding_window_view(series[:-1], 10)
+        y = series[10:]
+        lstm.fit(X, y, epochs=epochs)
+
+    def test_predict_matches_keras_model(self, series):
+        lstm = pm.RealLSTM()
+        self._fit(lstm, series)
+        assert lstm.trained
+
+        predictions = lstm.predict(series, steps=3)
+        assert predictions.shape == (3,)
+
+        # Reference: the original per-step model.predict with scaler transforms
+        window = list(lstm.scaler.transform(series[-10:].reshape(-1, 1)).flatten())
+        expected = []
+        for _ in range(3):
+            step = lstm.model.predict(np.array(window[-10:]).reshape(1, 10, 1), verbose=0)[0, 0]
+            window.append(step)
+            expected.append(step)
+        expected = lstm.scaler.inverse_transform(np.array(expected).reshape(-1, 1)).flatten()
+
+        # FP16 weights in the TFLite interpreter allow a small drift
+        tolerance = 0.05 * np.ptp(series) if lstm._infer is not None else 1e-4
+        np.testing.assert_allclose(predictions, expected, atol=tolerance)
+
+    def test_keras_step_fallback(self, series):
+        lstm = pm.RealLSTM()
+        self._fit(lstm, series)
+        with_tflite = lstm.predict(series, steps=2)
+        lstm._infer = None
+        with_keras = lstm.predict(series, steps=2)
+        np.testing.assert_allclose(with_tflite, with_keras, atol=0.05 * np.ptp(series))
+
+    def test_warm_start_continues_epochs(self, series):
+        lstm = pm.RealLSTM()
+        self._fit(lstm, series, epochs=3)
+        first = lstm.total_epochs
+        assert 0 < first <= 3
+        seen = lstm.scaler.n_samples_seen_
+        mean, scale = lstm.scaler.mean_.copy(), lstm.scaler.scale_.copy()
+
+        # An overlapping, shifted window must not refit the scaler
+        self._fit(lstm, series + 5.0)
+        assert first < lstm.total_epochs <= first + pm.RealLSTM.WARM_START_EPOCHS
+        assert lstm.scaler.n_samples_seen_ == seen
+        np.testing.assert_array_equal(lstm.scaler.mean_, mean)
+        np.testing.assert_array_equal(lstm.scaler.scale_, scale)
+
+    def test_untrained_falls_back_to_moving_average(self, series):
+        lstm = pm.RealLSTM()
+        np.testing.assert_allclose(lstm.predict(series, steps=4),
+                                   np.full(4, np.mean(series[-10:])))